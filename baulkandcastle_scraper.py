@@ -141,6 +141,11 @@ class PropertyDB:
                     model_version TEXT
                 )
             ''')
+            # Latest-row-per-property lookups by status (used by ML predictions)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_lh_status_pid_date
+                ON listing_history(status, property_id, date DESC)
+            ''')
             conn.commit()
 
     def save_listings(self, listings: List[PropertyListing]):
@@ -41,6 +41,37 @@ POSTCODES = {
     "CASTLE HILL": "2154"
 }
 
+# Address slug: drop apostrophes/commas, "/" becomes "-" (see address_to_domain_url)
+_SLUG_TABLE = str.maketrans({"'": None, ",": None, "/": "-"})
+_SLUG_SEPARATOR_RE = re.compile(r'[\s-]+')
+
+# Price string patterns (compiled once, see parse_price_string)
+_MILLIONS_RE = re.compile(r'\$?([\d.]+)\s*m')
+_THOUSANDS_RE = re.compile(r'\$?([\d.]+)\s*k')
+_PRICE_CLEAN_RE = re.compile(r'[^\d]')
+
+# Snapshot patterns (compiled once, see parse_snapshot_text)
+_BEDS_RE = re.compile(r'(\d+)\s*Beds?')
+_BATHS_RE = re.compile(r'(\d+)\s*Baths?')
+_PARKING_RE = re.compile(r'(\d+)\s*Parking')
+_LAND_RE = re.compile(r'([\d,]+)m²')
+_TYPE_RE = re.compile(r'•\s*(\w+)')
+_ESTIMATE_RES = {
+    'estimate_low': re.compile(r'heading "Low".*?text:\s*(\$[\d.]+[mk]?)', re.IGNORECASE | re.DOTALL),
+    'estimate_mid': re.compile(r'heading "Mid".*?text:\s*(\$[\d.]+[mk]?)', re.IGNORECASE | re.DOTALL),
+    'estimate_high': re.compile(r'heading "High".*?text:\s*(\$[\d.]+[mk]?)', re.IGNORECASE | re.DOTALL),
+}
+_ESTIMATE_DATE_RE = re.compile(r'Updated:\s*(\d+\s+\w+,?\s+\d{4})')
+_RENTAL_RE = re.compile(r'\$(\d+)(?:\s*(?:\+|-)[\d.]+%)?\s*(?:Rental yield|per week|/week)')
+_RENTAL_PARAGRAPH_RE = re.compile(r'paragraph:\s*\$(\d+)')
+_YIELD_RE = re.compile(r'([\d.]+)%\s*Rental yield')
+_SOLD_RE = re.compile(r'Sold\s+(\$[\d.,]+[mk]?)', re.IGNORECASE)
+_SOLD_DATE_RE = re.compile(r'text:\s*(\w{3}\s+\d{4})\s*\n.*?Sold', re.DOTALL)
+_DAYS_LISTED_RE = re.compile(r'(\d+)\s*days?\s*listed')
+_SOLD_AGENT_RE = re.compile(r'Sold by.*?link "([^"]+)"')
+_FEATURES_RE = re.compile(r'Property features.*?heading', re.DOTALL)
+_FEATURE_ITEM_RE = re.compile(r'listitem:\s*([^\n]+)')
+
 
 @dataclass
 class DomainEstimate:
@@ -101,13 +132,9 @@ def address_to_domain_url(address: str, suburb: str) -> str:
             addr_clean = addr_clean[:-len(sub_variant)].strip()
             addr_clean = addr_clean.rstrip(',').strip()
 
-    # Clean special characters
-    addr_slug = addr_clean.replace("'", "")
-    addr_slug = addr_slug.replace(",", "")
-    addr_slug = addr_slug.replace("/", "-")
-    addr_slug = re.sub(r'\s+', '-', addr_slug)
-    addr_slug = re.sub(r'-+', '-', addr_slug)
-    addr_slug = addr_slug.strip('-')
+    # Clean special characters, then collapse whitespace/hyphen runs
+    addr_slug = addr_clean.translate(_SLUG_TABLE)
+    addr_slug = _SLUG_SEPARATOR_RE.sub('-', addr_slug).strip('-')
 
     suburb_slug = suburb.lower().replace(" ", "-")
     postcode = POSTCODES.get(suburb.upper(), "2153")
@@ -209,27 +236,44 @@ def get_estimate_stats() -> Dict[str, int]:
         }
 
 
+def _scale_price(number: str, multiplier: int) -> Optional[int]:
+    """Scale a '1.33' style number by multiplier without float rounding.
+
+    Returns None for malformed numbers such as '1.2.3' or '.'.
+    """
+    whole, _, frac = number.partition('.')
+    if '.' in frac or not (whole or frac):
+        return None
+    return int(whole + frac) * multiplier // 10 ** len(frac)
+
+
 def parse_price_string(price_str: str) -> Optional[int]:
-    """Parse a price string like '$1.33m' or '$1,330,000' to integer."""
+    """Parse a price string like '$1.33m' or '$1,330,000' to integer.
+
+    Shorthand values are scaled with integer arithmetic, so '$2.01m' is
+    exactly 2010000.
+    """
     if not price_str:
         return None
 
-    price_str = price_str.strip().lower()
+    price_str = price_str.lower()
 
     # Handle millions shorthand ($1.33m)
     if 'm' in price_str:
-        match = re.search(r'\$?([\d.]+)\s*m', price_str)
+        match = _MILLIONS_RE.search(price_str)
         if match:
-            return int(float(match.group(1)) * 1_000_000)
+            return _scale_price(match.group(1), 1_000_000)
 
     # Handle thousands shorthand ($800k)
     if 'k' in price_str:
-        match = re.search(r'\$?([\d.]+)\s*k', price_str)
+        match = _THOUSANDS_RE.search(price_str)
         if match:
-            return int(float(match.group(1)) * 1_000)
+            return _scale_price(match.group(1), 1_000)
 
-    # Handle full numbers ($1,330,000)
-    clean = re.sub(r'[^\d]', '', price_str)
+    # Handle full numbers ($1,330,000) - plain shapes skip the regex
+    clean = price_str.replace(',', '').lstrip('$')
+    if not clean.isdecimal():
+        clean = _PRICE_CLEAN_RE.sub('', price_str)
     if clean:
         return int(clean)
 
@@ -241,11 +285,11 @@ def parse_snapshot_text(snapshot_text: str) -> Dict[str, Any]:
     data = {}
 
     # Property type and details (e.g., "3 Beds 2 Baths 2 Parking 4,277m² •Townhouse")
-    beds_match = re.search(r'(\d+)\s*Beds?', snapshot_text)
-    baths_match = re.search(r'(\d+)\s*Baths?', snapshot_text)
-    parking_match = re.search(r'(\d+)\s*Parking', snapshot_text)
-    land_match = re.search(r'([\d,]+)m²', snapshot_text)
-    type_match = re.search(r'•\s*(\w+)', snapshot_text)
+    beds_match = _BEDS_RE.search(snapshot_text)
+    baths_match = _BATHS_RE.search(snapshot_text)
+    parking_match = _PARKING_RE.search(snapshot_text)
+    land_match = _LAND_RE.search(snapshot_text)
+    type_match = _TYPE_RE.search(snapshot_text)
 
     if beds_match:
         data['beds'] = int(beds_match.group(1))
@@ -259,16 +303,10 @@ def parse_snapshot_text(snapshot_text: str) -> Dict[str, Any]:
         data['property_type'] = type_match.group(1)
 
     # Property value estimates
-    low_match = re.search(r'heading "Low".*?text:\s*(\$[\d.]+[mk]?)', snapshot_text, re.IGNORECASE | re.DOTALL)
-    mid_match = re.search(r'heading "Mid".*?text:\s*(\$[\d.]+[mk]?)', snapshot_text, re.IGNORECASE | re.DOTALL)
-    high_match = re.search(r'heading "High".*?text:\s*(\$[\d.]+[mk]?)', snapshot_text, re.IGNORECASE | re.DOTALL)
-
-    if low_match:
-        data['estimate_low'] = parse_price_string(low_match.group(1))
-    if mid_match:
-        data['estimate_mid'] = parse_price_string(mid_match.group(1))
-    if high_match:
-        data['estimate_high'] = parse_price_string(high_match.group(1))
+    for field, pattern in _ESTIMATE_RES.items():
+        match = pattern.search(snapshot_text)
+        if match:
+            data[field] = parse_price_string(match.group(1))
 
     # Accuracy
     if 'High accuracy' in snapshot_text:
@@ -279,17 +317,17 @@ def parse_snapshot_text(snapshot_text: str) -> Dict[str, Any]:
         data['estimate_accuracy'] = 'Low'
 
     # Estimate date
-    date_match = re.search(r'Updated:\s*(\d+\s+\w+,?\s+\d{4})', snapshot_text)
+    date_match = _ESTIMATE_DATE_RE.search(snapshot_text)
     if date_match:
         data['estimate_date'] = date_match.group(1)
 
     # Rental estimate - format: "paragraph: $860 +2.93% Rental yield"
     # or "$860/week" or "$860 per week"
-    rental_match = re.search(r'\$(\d+)(?:\s*(?:\+|-)[\d.]+%)?\s*(?:Rental yield|per week|/week)', snapshot_text)
+    rental_match = _RENTAL_RE.search(snapshot_text)
     if not rental_match:
         # Try alternate format: just "$XXX" near "Rental yield"
-        rental_match = re.search(r'paragraph:\s*\$(\d+)', snapshot_text)
-    yield_match = re.search(r'([\d.]+)%\s*Rental yield', snapshot_text)
+        rental_match = _RENTAL_PARAGRAPH_RE.search(snapshot_text)
+    yield_match = _YIELD_RE.search(snapshot_text)
 
     if rental_match:
         data['rental_weekly'] = int(rental_match.group(1))
@@ -298,20 +336,20 @@ def parse_snapshot_text(snapshot_text: str) -> Dict[str, Any]:
 
     # Sale history - format: "text: Sold $1.2788m PRIVATE TREATY"
     # or "Sold $1,278,800"
-    sold_price_match = re.search(r'Sold\s+(\$[\d.,]+[mk]?)', snapshot_text, re.IGNORECASE)
+    sold_price_match = _SOLD_RE.search(snapshot_text)
     if sold_price_match:
         data['last_sold_price'] = parse_price_string(sold_price_match.group(1))
 
     # Sale date - format: "text: Aug 2021" before "Sold"
-    sold_date_match = re.search(r'text:\s*(\w{3}\s+\d{4})\s*\n.*?Sold', snapshot_text, re.DOTALL)
+    sold_date_match = _SOLD_DATE_RE.search(snapshot_text)
     if sold_date_match:
         data['last_sold_date'] = sold_date_match.group(1)
 
-    days_match = re.search(r'(\d+)\s*days?\s*listed', snapshot_text)
+    days_match = _DAYS_LISTED_RE.search(snapshot_text)
     if days_match:
         data['last_sold_days_listed'] = int(days_match.group(1))
 
-    agent_match = re.search(r'Sold by.*?link "([^"]+)"', snapshot_text)
+    agent_match = _SOLD_AGENT_RE.search(snapshot_text)
     if agent_match:
         data['last_sold_agent'] = agent_match.group(1)
 
@@ -323,9 +361,9 @@ def parse_snapshot_text(snapshot_text: str) -> Dict[str, Any]:
 
     # Features
     features = []
-    feature_section = re.search(r'Property features.*?heading', snapshot_text, re.DOTALL)
+    feature_section = _FEATURES_RE.search(snapshot_text)
     if feature_section:
-        for feat in re.findall(r'listitem:\s*([^\n]+)', feature_section.group(0)):
+        for feat in _FEATURE_ITEM_RE.findall(feature_section.group(0)):
             features.append(feat.strip())
     if features:
         data['features'] = ','.join(features)
@@ -0,0 +1,14 @@
+-- Migration: Add (status, property_id, date) index to listing_history
+-- Purpose: Fast latest-row-per-property lookups by status for ML predictions
+-- Run: sqlite3 baulkandcastle_properties.db < migrations/add_listing_history_status_index.sql
+-- (The scraper also creates this index on startup for new and existing databases)
+
+CREATE INDEX IF NOT EXISTS idx_lh_status_pid_date
+ON listing_history(status, property_id, date DESC);
+
+-- Verify migration
+SELECT
+    'Migration complete' as status,
+    name as index_name
+FROM sqlite_master
+WHERE type = 'index' AND name = 'idx_lh_status_pid_date';
@@ -7,6 +7,7 @@ with execution history tracking and status monitoring.
 
 import json
 import os
+import re
 import subprocess
 import sys
 import threading
@@ -24,6 +25,12 @@ from baulkandcastle.core.database import (
 )
 from baulkandcastle.logging_config import get_logger
 
+# orjson is optional: it decodes the tool JSON summaries faster than json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = get_logger(__name__)
 
 # Thread pool for running tools (max 2 concurrent)
@@ -45,6 +52,28 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 VENV_PYTHON = PROJECT_ROOT / ".venv" / "Scripts" / "python.exe"
 PYTHON_CMD = str(VENV_PYTHON) if VENV_PYTHON.exists() else "python"
 
+# Markers tools print around their JSON summary on stdout
+_JSON_SUMMARY_START = "---JSON_SUMMARY_START---"
+_JSON_SUMMARY_END = "---JSON_SUMMARY_END---"
+
+# Stderr tokens that mark a real failure rather than a warning (e.g. UserWarning)
+_STDERR_ERROR = re.compile(
+    r"traceback|error:|exception|failed|importerror|syntaxerror", re.IGNORECASE
+)
+
+# Keywords marking the most useful stdout line for each tool's fallback summary
+_TOOL_PATTERNS = {
+    "scraper": re.compile(r"properties|scraped", re.IGNORECASE),
+    "domain-estimator": re.compile(r"estimate|processed", re.IGNORECASE),
+    "train-model": re.compile(r"r2|mae|trained", re.IGNORECASE),
+    "ml-batch-estimates": re.compile(r"predict|properties", re.IGNORECASE),
+}
+
+# Fallback summaries only look at the tail of stdout, so huge logs are never split whole
+_SUMMARY_TAIL_CHARS = 4096
+_SUMMARY_TAIL_LINES = 50
+_SUMMARY_MAX_LEN = 200
+
 
 # Tool definitions with metadata and flag schemas
 TOOL_DEFINITIONS = {
@@ -740,13 +769,27 @@ def _validate_python() -> bool:
         return False
 
 
+def _tail_lines(text: str) -> List[str]:
+    """Split the last _SUMMARY_TAIL_CHARS of text into at most _SUMMARY_TAIL_LINES lines.
+
+    A line cut by the character limit is dropped, except the last line, which is
+    always returned whole.
+    """
+    start = len(text) - _SUMMARY_TAIL_CHARS
+    if start > 0:
+        start = text.find("\n", start) + 1 or text.rfind("\n") + 1
+    else:
+        start = 0
+    return text[start:].split("\n")[-_SUMMARY_TAIL_LINES:]
+
+
 def _extract_summary(stdout: str, stderr: str, tool_id: str) -> tuple[str, Optional[str]]:
     """Extract a human-readable summary and JSON data from tool output.
 
     Returns:
         Tuple of (human_readable_summary, json_string_or_none)
     """
-    lines = stdout.strip().split("\n") if stdout else []
+    lines = _tail_lines(stdout.strip()) if stdout else []
     summary_json: Optional[str] = None
 
     # Try to extract structured JSON summary first
@@ -758,52 +801,21 @@ def _extract_summary(stdout: str, stderr: str, tool_id: str) -> tuple[str, Optio
         if human_summary:
             return human_summary, summary_json
 
-    # Tool-specific summary extraction (fallback)
-    if tool_id == "scraper":
-        # Look for summary lines in scraper output
-        for line in reversed(lines):
-            if "properties" in line.lower() or "scraped" in line.lower():
-                return line.strip(), summary_json
-        if lines:
-            return lines[-1][:200], summary_json
-
-    elif tool_id == "domain-estimator":
-        # Look for estimate count or stats
-        for line in reversed(lines):
-            if "estimate" in line.lower() or "processed" in line.lower():
-                return line.strip(), summary_json
-        if lines:
-            return lines[-1][:200], summary_json
-
-    elif tool_id == "train-model":
-        # Look for model metrics
-        for line in reversed(lines):
-            if "r2" in line.lower() or "mae" in line.lower() or "trained" in line.lower():
-                return line.strip(), summary_json
-        if lines:
-            return lines[-1][:200], summary_json
-
-    elif tool_id == "ml-batch-estimates":
-        # Look for prediction count
+    # Tool-specific summary extraction (fallback): latest line with a keyword
+    pattern = _TOOL_PATTERNS.get(tool_id)
+    if pattern is not None:
         for line in reversed(lines):
-            if "predict" in line.lower() or "properties" in line.lower():
-                return line.strip(), summary_json
-        if lines:
-            return lines[-1][:200], summary_json
+            if pattern.search(line):
+                return line.strip()[:_SUMMARY_MAX_LEN], summary_json
 
     # Default: last non-empty line
     if lines:
-        return lines[-1][:200], summary_json
+        return lines[-1][:_SUMMARY_MAX_LEN], summary_json
 
     # Final fallback - distinguish errors from warnings
     if stderr:
-        stderr_lower = stderr.lower()
         # Only treat as error if it contains actual error indicators
-        is_actual_error = any(
-            x in stderr_lower
-            for x in ["traceback", "error:", "exception", "failed", "importerror", "syntaxerror"]
-        )
-        if is_actual_error:
+        if _STDERR_ERROR.search(stderr):
             return f"Error: {stderr.strip()[:100]}", summary_json
         else:
             # Just warnings (e.g., XGBoost UserWarning), not an error
@@ -820,22 +832,21 @@ def _extract_json_summary(stdout: str) -> Optional[Dict[str, Any]]:
     if not stdout:
         return None
 
-    start_marker = "---JSON_SUMMARY_START---"
-    end_marker = "---JSON_SUMMARY_END---"
-
-    start_idx = stdout.find(start_marker)
+    start_idx = stdout.find(_JSON_SUMMARY_START)
     if start_idx == -1:
         return None
+    start_idx += len(_JSON_SUMMARY_START)
 
-    end_idx = stdout.find(end_marker, start_idx)
+    end_idx = stdout.find(_JSON_SUMMARY_END, start_idx)
     if end_idx == -1:
         return None
 
-    json_str = stdout[start_idx + len(start_marker) : end_idx].strip()
+    json_str = stdout[start_idx:end_idx].strip()
 
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
+        return _json_loads(json_str)
+    except ValueError as e:
+        # json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
         logger.warning("Failed to parse JSON summary: %s", e)
         return None
 
@@ -40,8 +40,8 @@ class DatabaseConfig:
     ))
 
     def __post_init__(self):
-        # Resolve relative paths
-        if not os.path.isabs(self.path):
+        # Resolve relative paths (SQLite "file:" URIs are used as given)
+        if not self.path.startswith("file:") and not os.path.isabs(self.path):
             self.path = str(_get_project_root() / self.path)
 
 
@@ -108,7 +108,7 @@ class MLConfig:
     @property
     def model_path(self) -> Path:
         """Path to the trained model file."""
-        return Path(self.model_dir) / "property_valuation_model.pkl"
+        return Path(self.model_dir) / "property_valuation_model.ubj"
 
     @property
     def metadata_path(self) -> Path:
@@ -39,7 +39,8 @@ def get_connection(
     """Context manager for database connections.
 
     Args:
-        db_path: Path to database file. Uses config default if not specified.
+        db_path: Path to database file, or a SQLite "file:" URI (e.g. a
+            shared in-memory database). Uses config default if not specified.
         as_dict: If True, rows are returned as dictionaries.
 
     Yields:
@@ -56,12 +57,15 @@ def get_connection(
     if db_path is None:
         db_path = get_config().database.path
 
+    is_uri = db_path.startswith("file:")
+
     # Ensure parent directory exists
-    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    if not is_uri:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path, uri=is_uri)
         if as_dict:
             conn.row_factory = dict_factory
         else:
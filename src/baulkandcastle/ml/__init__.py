@@ -9,10 +9,12 @@ from baulkandcastle.ml.valuation_predictor import PropertyValuationModel
 from baulkandcastle.ml.feature_engineering import (
     engineer_features,
     compute_rolling_avg_price_per_m2,
+    compute_rolling_avg_price_per_m2_batch,
 )
 
 __all__ = [
     "PropertyValuationModel",
     "engineer_features",
     "compute_rolling_avg_price_per_m2",
+    "compute_rolling_avg_price_per_m2_batch",
 ]
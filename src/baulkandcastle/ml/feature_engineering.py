@@ -19,6 +19,24 @@ from baulkandcastle.utils.property_types import (
 )
 from baulkandcastle.logging_config import get_logger
 
+# Numba is optional: without it the rolling-window kernel runs as plain Python
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
 logger = get_logger(__name__)
 
 # Feature column names
@@ -43,6 +61,9 @@ FEATURE_COLUMNS = [
     "rolling_avg_price_per_m2",
 ]
 
+# Column position of each feature in FEATURE_COLUMNS
+FEATURE_INDEX = {name: idx for idx, name in enumerate(FEATURE_COLUMNS)}
+
 
 def parse_land_size(land_size_str: str) -> Optional[float]:
     """Extract numeric land size from string like '450m²' or '450'.
@@ -195,6 +216,105 @@ def compute_rolling_avg_price_per_m2(
     return 5000.0
 
 
+@njit(cache=True, parallel=True)
+def _rolling_window_mean(
+    ts: np.ndarray,
+    values: np.ndarray,
+    groups: np.ndarray,
+    window_ns: int,
+    min_count: int,
+) -> np.ndarray:
+    """Mean of valid values in the trailing window before each row.
+
+    Arrays must be sorted by (group, ts). For row i the window covers rows of
+    the same group with ``ts[i] - window_ns <= ts[j] < ts[i]``. Rows whose
+    window holds fewer than ``min_count`` valid (positive) values get NaN.
+    """
+    n = ts.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        total = 0.0
+        count = 0
+        j = i - 1
+        while j >= 0 and groups[j] == groups[i] and ts[i] - ts[j] <= window_ns:
+            v = values[j]
+            if ts[j] < ts[i] and v > 0:
+                total += v
+                count += 1
+            j -= 1
+        out[i] = total / count if count >= min_count else np.nan
+    return out
+
+
+def _grouped_window_mean(
+    ts: np.ndarray,
+    values: np.ndarray,
+    groups: np.ndarray,
+    window_ns: int,
+    min_count: int,
+) -> np.ndarray:
+    """Run _rolling_window_mean in (group, ts) order, returning input order.
+
+    The sort is skipped when rows already arrive in that order, e.g. from a
+    frame sorted by (suburb, sold_date_parsed).
+    """
+    same_group = groups[1:] == groups[:-1]
+    if np.all((groups[1:] > groups[:-1]) | (same_group & (ts[1:] >= ts[:-1]))):
+        return _rolling_window_mean(ts, values, groups, window_ns, min_count)
+
+    order = np.lexsort((ts, groups))
+    out = np.empty(len(ts), dtype=np.float64)
+    out[order] = _rolling_window_mean(
+        ts[order], values[order], groups[order], window_ns, min_count
+    )
+    return out
+
+
+def compute_rolling_avg_price_per_m2_batch(
+    df: pd.DataFrame,
+    lookback_days: int = 180,
+    default: float = 5000.0,
+) -> np.ndarray:
+    """Compute the rolling average price per m2 for every row at once.
+
+    Vectorized equivalent of calling :func:`compute_rolling_avg_price_per_m2`
+    with each row's ``sold_date_parsed`` and ``suburb``: the suburb window is
+    used when it holds at least 5 sales, then the all-suburb window, then
+    ``default``. Rows without a sold date get NaN.
+
+    Args:
+        df: DataFrame with suburb, price_per_m2 and sold_date_parsed columns.
+        lookback_days: Number of days to look back.
+        default: Fallback when neither window has enough sales.
+
+    Returns:
+        Array of averages aligned with ``df`` rows.
+    """
+    result = np.full(len(df), np.nan)
+    dates = pd.to_datetime(df["sold_date_parsed"])
+    rows = np.flatnonzero(dates.notna().to_numpy())
+    if len(rows) == 0:
+        return result
+
+    ts = dates.to_numpy(dtype="datetime64[ns]")[rows].view("i8")
+    prices = pd.to_numeric(df["price_per_m2"], errors="coerce").to_numpy(dtype=np.float64)[rows]
+    suburbs = df["suburb"].astype(str).str.upper().to_numpy()[rows]
+    codes = pd.factorize(suburbs)[0].astype(np.int64)
+    window_ns = int(pd.Timedelta(days=lookback_days).value)
+
+    # Suburb window first, then the all-suburb window as fallback
+    suburb_avg = _grouped_window_mean(ts, prices, codes, window_ns, 5)
+    no_groups = np.zeros(len(rows), dtype=np.int64)
+    overall_avg = _grouped_window_mean(ts, prices, no_groups, window_ns, 5)
+
+    result[rows] = np.where(
+        np.isnan(suburb_avg),
+        np.where(np.isnan(overall_avg), default, overall_avg),
+        suburb_avg,
+    )
+    return result
+
+
 def build_rolling_avg_cache(
     df: pd.DataFrame,
     suburbs: List[str],
@@ -2,6 +2,6 @@
 Model storage directory for trained ML models.
 
 Contains:
-- property_valuation_model.pkl: Trained XGBoost model
+- property_valuation_model.ubj: Trained XGBoost model (native UBJSON format)
 - training_metadata.json: Model metadata and metrics
 """
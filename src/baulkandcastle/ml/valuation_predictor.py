@@ -9,9 +9,11 @@ XGBoost-based ML model for predicting property values with support for:
 Author: Antigravity (for Goran)
 """
 
+import hashlib
 import json
+import os
 import sqlite3
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -32,17 +34,31 @@ from baulkandcastle.exceptions import (
 from baulkandcastle.logging_config import get_logger
 from baulkandcastle.ml.feature_engineering import (
     FEATURE_COLUMNS,
+    FEATURE_INDEX,
     engineer_features,
     parse_land_size,
-    compute_rolling_avg_price_per_m2,
+    compute_rolling_avg_price_per_m2_batch,
 )
-from baulkandcastle.utils.date_parser import parse_date
+from baulkandcastle.utils.date_parser import parse_date_series
 from baulkandcastle.utils.property_types import (
+    PROPERTY_TYPE_MAP,
     consolidate_property_type,
     get_default_land_size,
     is_unit_type,
 )
 
+# pyarrow is optional: without it prepare_features output is not cached on disk
+try:
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Part of the feature cache key; bump whenever prepare_features or the parsing
+# it depends on changes its output, so cached parquet files are not reused
+_FEATURE_PIPELINE_VERSION = 2
+
 logger = get_logger(__name__)
 
 
@@ -63,12 +79,14 @@ class PropertyValuationModel:
         self.model_dir = Path(model_dir)
         self.model_dir.mkdir(parents=True, exist_ok=True)
 
-        self.model_path = self.model_dir / "property_valuation_model.pkl"
+        self.model_path = self.model_dir / "property_valuation_model.ubj"
+        self.legacy_model_path = self.model_dir / "property_valuation_model.pkl"
         self.metadata_path = self.model_dir / "training_metadata.json"
 
         self.model: Optional[XGBRegressor] = None
         self.metadata: Dict = {}
         self.rolling_avg_cache: Dict[str, float] = {}
+        self._median_cache: Dict[str, float] = {}
 
     def load_training_data(self, db_path: str) -> pd.DataFrame:
         """Load sold properties from database for training.
@@ -109,18 +127,19 @@ class PropertyValuationModel:
         logger.info("Loaded %d raw records", len(df))
 
         # Consolidate property types
-        df["property_type_consolidated"] = df["property_type"].apply(consolidate_property_type)
-
-        # Parse sold dates
-        def parse_sold_date(row):
-            # Prefer ISO format
-            if pd.notna(row.get("sold_date_iso")):
-                dt = parse_date(str(row["sold_date_iso"]))
-                if dt:
-                    return dt
-            return parse_date(row.get("sold_date"))
+        df["property_type_consolidated"] = (
+            df["property_type"]
+            .astype("string")
+            .str.lower()
+            .str.strip()
+            .map(PROPERTY_TYPE_MAP)
+            .fillna("other")
+            .astype("category")
+        )
 
-        df["sold_date_parsed"] = df.apply(parse_sold_date, axis=1)
+        # Parse sold dates, preferring the ISO column
+        sold_date_parsed = parse_date_series(df["sold_date_iso"])
+        df["sold_date_parsed"] = sold_date_parsed.fillna(parse_date_series(df["sold_date"]))
 
         # Remove rows without valid sold date
         initial_count = len(df)
@@ -136,93 +155,172 @@ class PropertyValuationModel:
             df: DataFrame with property data.
 
         Returns:
-            DataFrame with engineered features.
+            DataFrame with engineered features, in the row order and with the
+            index of df.
         """
-        df = df.copy()
-
-        # Parse land size
-        df["land_size_numeric"] = df["land_size"].apply(parse_land_size)
-
-        # Track real land size data
-        df["has_real_land_size"] = df["land_size_numeric"].notna().astype(int)
+        # Sort once by (suburb, sale date) so the rolling window scan walks
+        # rows in memory order instead of re-sorting; undone before returning
+        input_index = df.index
+        sort_order = None
+        if "sold_date_parsed" in df.columns:
+            sort_order = (
+                df[["suburb", "sold_date_parsed"]]
+                .reset_index(drop=True)
+                .sort_values(["suburb", "sold_date_parsed"], kind="mergesort")
+                .index.to_numpy()
+            )
+            df = df.take(sort_order).reset_index(drop=True)
+
+        n = len(df)
+        col = FEATURE_INDEX
+        out = np.empty((n, len(FEATURE_COLUMNS)), dtype=np.float32)
+
+        # Per-type row masks from categorical codes (integer compares, not strings)
+        prop_types = df["property_type_consolidated"].astype("category")
+        type_codes = prop_types.cat.codes.to_numpy()
+        no_rows = np.zeros(n, dtype=bool)
+        type_masks = {
+            name: type_codes == code for code, name in enumerate(prop_types.cat.categories)
+        }
+        is_unit = type_masks.get("unit", no_rows)
+        is_house = type_masks.get("house", no_rows)
 
-        # Handle land size by property type
-        is_unit = df["property_type_consolidated"] == "unit"
+        # Parse land size and track real land size data
+        land = np.array(df["land_size"].map(parse_land_size), dtype=np.float64)
+        has_real_land = ~np.isnan(land)
 
         # Units: land size is not applicable
-        df.loc[is_unit, "land_size_numeric"] = 0
-        df.loc[is_unit, "has_real_land_size"] = 0
+        land[is_unit] = 0
+        has_real_land[is_unit] = False
 
         # Houses/townhouses: impute missing with median
-        for prop_type in ["house", "townhouse", "other"]:
-            mask = (df["property_type_consolidated"] == prop_type) & df["land_size_numeric"].isna()
-            type_median = df.loc[
-                (df["property_type_consolidated"] == prop_type) & df["land_size_numeric"].notna(),
-                "land_size_numeric",
-            ].median()
-            if pd.notna(type_median):
-                df.loc[mask, "land_size_numeric"] = type_median
-            else:
-                df.loc[mask, "land_size_numeric"] = get_default_land_size(prop_type)
-            df.loc[mask, "has_real_land_size"] = 0
+        for type_name in ["house", "townhouse", "other"]:
+            of_type = type_masks.get(type_name, no_rows)
+            missing = of_type & np.isnan(land)
+            if missing.any():
+                known = land[of_type & ~missing]
+                land[missing] = np.median(known) if len(known) else get_default_land_size(type_name)
 
         # Ensure numeric columns
-        df["beds"] = pd.to_numeric(df["beds"], errors="coerce").fillna(3)
-        df["baths"] = pd.to_numeric(df["baths"], errors="coerce").fillna(2)
-        df["cars"] = pd.to_numeric(df["cars"], errors="coerce").fillna(1)
+        beds = pd.to_numeric(df["beds"], errors="coerce").fillna(3).to_numpy(dtype=np.float64)
+        baths = pd.to_numeric(df["baths"], errors="coerce").fillna(2).to_numpy(dtype=np.float64)
+        cars = pd.to_numeric(df["cars"], errors="coerce").fillna(1).to_numpy(dtype=np.float64)
+
+        out[:, col["land_size_numeric"]] = land
+        out[:, col["beds"]] = beds
+        out[:, col["baths"]] = baths
+        out[:, col["cars"]] = cars
+        out[:, col["has_real_land_size"]] = has_real_land
 
         # Derived ratios
-        df["bedroom_to_land_ratio"] = df["beds"] / df["land_size_numeric"].clip(lower=1)
-        df.loc[is_unit, "bedroom_to_land_ratio"] = 0
-        df["bathroom_to_bedroom_ratio"] = df["baths"] / df["beds"].clip(lower=1)
+        out[:, col["bedroom_to_land_ratio"]] = np.where(is_unit, 0, beds / np.maximum(land, 1))
+        out[:, col["bathroom_to_bedroom_ratio"]] = baths / np.maximum(beds, 1)
 
         # Suburb encoding
-        df["suburb_castle_hill"] = df["suburb"].str.upper().str.contains("CASTLE").astype(int)
+        out[:, col["suburb_castle_hill"]] = (
+            df["suburb"].str.upper().str.contains("CASTLE", na=False).to_numpy(dtype=bool)
+        )
 
         # Property type one-hot encoding
-        df["property_type_house"] = (df["property_type_consolidated"] == "house").astype(int)
-        df["property_type_unit"] = (df["property_type_consolidated"] == "unit").astype(int)
-        df["property_type_townhouse"] = (df["property_type_consolidated"] == "townhouse").astype(int)
+        out[:, col["property_type_house"]] = is_house
+        out[:, col["property_type_unit"]] = is_unit
+        out[:, col["property_type_townhouse"]] = type_masks.get("townhouse", no_rows)
 
         # House with large land indicator
-        df["is_house_large_land"] = (
-            (df["property_type_consolidated"] == "house")
-            & (df["land_size_numeric"] > 500)
-            & (df["has_real_land_size"] == 1)
-        ).astype(int)
+        out[:, col["is_house_large_land"]] = (is_house & (land > 500) & has_real_land).view(np.int8)
 
-        # Seasonal features
-        if "sold_date_parsed" in df.columns:
-            df["sale_month"] = df["sold_date_parsed"].dt.month
+        # Seasonal features (NaN months from missing dates match no season)
+        has_dates = "sold_date_parsed" in df.columns
+        if has_dates:
+            sold_dates = pd.to_datetime(df["sold_date_parsed"])
+            sale_month = sold_dates.dt.month.to_numpy(dtype=np.float64)
         else:
-            df["sale_month"] = 6
+            sale_month = np.full(n, 6.0)
 
-        df["is_spring"] = df["sale_month"].isin([9, 10, 11]).astype(int)
-        df["is_summer"] = df["sale_month"].isin([12, 1, 2]).astype(int)
-        df["is_autumn"] = df["sale_month"].isin([3, 4, 5]).astype(int)
-        df["is_winter"] = df["sale_month"].isin([6, 7, 8]).astype(int)
+        out[:, col["is_spring"]] = np.isin(sale_month, (9, 10, 11))
+        out[:, col["is_summer"]] = np.isin(sale_month, (12, 1, 2))
+        out[:, col["is_autumn"]] = np.isin(sale_month, (3, 4, 5))
+        out[:, col["is_winter"]] = np.isin(sale_month, (6, 7, 8))
 
         # Years since sale
-        now = datetime.now()
-        if "sold_date_parsed" in df.columns:
-            df["years_since_sale"] = (now - df["sold_date_parsed"]).dt.days / 365.25
+        if has_dates:
+            days = (datetime.now() - sold_dates).dt.days.to_numpy(dtype=np.float64)
+            out[:, col["years_since_sale"]] = days / 365.25
         else:
-            df["years_since_sale"] = 0
+            out[:, col["years_since_sale"]] = 0
 
         # Rolling average price per m2
-        if "sold_date_parsed" in df.columns and "price_per_m2" in df.columns:
-            df["rolling_avg_price_per_m2"] = df.apply(
-                lambda row: compute_rolling_avg_price_per_m2(
-                    df, row["sold_date_parsed"], row["suburb"]
-                )
-                if pd.notna(row["sold_date_parsed"])
-                else 10000.0,
-                axis=1,
+        if has_dates and "price_per_m2" in df.columns:
+            rolling_avg = compute_rolling_avg_price_per_m2_batch(df)
+            out[:, col["rolling_avg_price_per_m2"]] = np.where(
+                np.isnan(rolling_avg), 10000.0, rolling_avg
             )
         else:
-            df["rolling_avg_price_per_m2"] = 10000.0
+            out[:, col["rolling_avg_price_per_m2"]] = 10000.0
 
-        return df
+        features = pd.DataFrame(out, columns=FEATURE_COLUMNS, index=df.index, copy=False)
+        result = pd.concat([df.drop(columns=FEATURE_COLUMNS, errors="ignore"), features], axis=1)
+
+        # Back to the caller's row order and index
+        if sort_order is not None:
+            result = result.take(np.argsort(sort_order))
+            result.index = input_index
+        return result
+
+    def _feature_cache_path(self, db_path: str, n_rows: int) -> Path:
+        """Get the parquet cache path for features prepared from db_path.
+
+        The key covers the feature pipeline version, the database mtime and
+        row count, the feature set and today's date (years_since_sale is
+        relative to now).
+        """
+        key_source = ":".join([
+            str(_FEATURE_PIPELINE_VERSION),
+            str(os.path.getmtime(db_path)),
+            str(n_rows),
+            date.today().isoformat(),
+            ",".join(FEATURE_COLUMNS),
+        ])
+        key = hashlib.sha1(key_source.encode("utf-8")).hexdigest()[:12]
+        return self.model_dir / f"features_{key}.parquet"
+
+    def _prepare_features_cached(
+        self, df: pd.DataFrame, db_path: str, use_cache: bool = True
+    ) -> pd.DataFrame:
+        """Prepare features, reusing a parquet copy from a previous run if valid.
+
+        Args:
+            df: DataFrame from load_training_data.
+            db_path: Path to the database df was loaded from.
+            use_cache: Set False to always recompute.
+
+        Returns:
+            DataFrame with engineered features.
+        """
+        if not (use_cache and PARQUET_AVAILABLE and os.path.exists(db_path)):
+            logger.info("Preparing features")
+            return self.prepare_features(df)
+
+        cache_path = self._feature_cache_path(db_path, len(df))
+        if cache_path.exists():
+            try:
+                logger.info("Loading cached features from %s", cache_path)
+                return pd.read_parquet(cache_path)
+            except Exception as e:
+                logger.warning("Ignoring unreadable feature cache %s: %s", cache_path, e)
+
+        logger.info("Preparing features")
+        features = self.prepare_features(df)
+
+        for stale in self.model_dir.glob("features_*.parquet"):
+            stale.unlink(missing_ok=True)
+        try:
+            features.to_parquet(cache_path, index=False)
+        except Exception as e:
+            logger.warning("Could not write feature cache %s: %s", cache_path, e)
+            cache_path.unlink(missing_ok=True)
+
+        return features
 
     def train(
         self,
@@ -230,6 +328,7 @@ class PropertyValuationModel:
         test_size: float = 0.2,
         random_state: int = 42,
         min_samples: int = 20,
+        use_feature_cache: bool = True,
     ) -> bool:
         """Train the XGBoost model on sold property data.
 
@@ -238,6 +337,8 @@ class PropertyValuationModel:
             test_size: Fraction of data for testing.
             random_state: Random seed for reproducibility.
             min_samples: Minimum samples required for training.
+            use_feature_cache: Reuse prepared features cached in model_dir
+                when the database has not changed since they were written.
 
         Returns:
             True if training succeeded.
@@ -270,15 +371,15 @@ class PropertyValuationModel:
         logger.info("Suburb distribution: %s", suburb_dist.to_dict())
 
         # Prepare features
-        logger.info("Preparing features")
-        df = self.prepare_features(df)
+        df = self._prepare_features_cached(df, db_path, use_cache=use_feature_cache)
 
         # Select features and target
         X = df[FEATURE_COLUMNS].copy()
         y = df["price_value"].copy()
 
-        # Handle NaN
-        X = X.fillna(X.median())
+        # Handle NaN (medians are reused for metadata and prediction defaults)
+        medians = X.median()
+        X = X.fillna(medians)
 
         # Train/test split
         X_train, X_test, y_train, y_test = train_test_split(
@@ -333,8 +434,9 @@ class PropertyValuationModel:
                 "type_distribution": type_dist.to_dict(),
                 "suburb_distribution": suburb_dist.to_dict(),
                 "feature_columns": FEATURE_COLUMNS,
-                "median_values": X.median().to_dict(),
+                "median_values": medians.to_dict(),
             }
+            self._median_cache = self.metadata["median_values"]
 
             # Save model
             self.save()
@@ -350,7 +452,12 @@ class PropertyValuationModel:
         if self.model is None:
             raise ModelNotFoundError("No model to save. Train the model first.")
 
-        joblib.dump(self.model, self.model_path)
+        # The legacy ml/ scripts (and the in-app train-model tool) share this
+        # directory and only read/write the pickle, so keep it in step.
+        # Written first so the native file is never older than it.
+        joblib.dump(self.model, self.legacy_model_path)
+        # Native UBJSON format: smaller and faster to load than a pickled wrapper
+        self.model.save_model(str(self.model_path))
         with open(self.metadata_path, "w") as f:
             json.dump(self.metadata, f, indent=2, default=str)
 
@@ -363,21 +470,133 @@ class PropertyValuationModel:
         Returns:
             True if model loaded successfully.
         """
-        if not self.model_path.exists():
+        # Prefer whichever format was written last (native on a tie): the
+        # legacy trainer only updates the pickle, leaving an older .ubj behind
+        candidates = [p for p in (self.model_path, self.legacy_model_path) if p.exists()]
+        if not candidates:
             logger.warning("Model not found at %s", self.model_path)
             return False
+        model_path = max(candidates, key=lambda p: p.stat().st_mtime)
 
         try:
-            self.model = joblib.load(self.model_path)
+            if model_path == self.legacy_model_path:
+                # Models trained before the switch to native format were pickled
+                self.model = joblib.load(model_path)
+            else:
+                self.model = XGBRegressor()
+                self.model.load_model(str(model_path))
             if self.metadata_path.exists():
                 with open(self.metadata_path, "r") as f:
                     self.metadata = json.load(f)
-            logger.info("Model loaded from %s", self.model_path)
+            self._median_cache = self.metadata.get("median_values", {})
+            logger.info("Model loaded from %s", model_path)
             return True
         except Exception as e:
             logger.error("Error loading model: %s", e)
             return False
 
+    def _build_features(
+        self,
+        land_size: float = None,
+        beds: int = 3,
+        bathrooms: int = 2,
+        car_spaces: int = 1,
+        suburb: str = "CASTLE HILL",
+        property_type: str = "house",
+        sale_month: int = None,
+        rolling_avg_price_per_m2: float = None,
+    ) -> Tuple[Dict[str, float], Dict]:
+        """Build the model feature row for a single property.
+
+        Takes the same arguments as :meth:`predict`.
+
+        Returns:
+            Tuple of (feature values keyed by FEATURE_COLUMNS, input summary).
+        """
+        # Consolidate property type
+        prop_type = consolidate_property_type(property_type)
+        is_unit = prop_type == "unit"
+
+        # Handle land size
+        if is_unit:
+            effective_land_size = 0
+            has_real_land_size = 0
+        else:
+            if land_size and land_size > 0:
+                effective_land_size = land_size
+                has_real_land_size = 1
+            else:
+                effective_land_size = get_default_land_size(prop_type)
+                has_real_land_size = 0
+
+        # Default sale month
+        if sale_month is None:
+            sale_month = datetime.now().month
+
+        # Default rolling average: training median, if known
+        if rolling_avg_price_per_m2 is None:
+            rolling_avg_price_per_m2 = self._median_cache.get("rolling_avg_price_per_m2", 10000)
+
+        # Build feature vector
+        features = {
+            "land_size_numeric": effective_land_size,
+            "beds": beds,
+            "baths": bathrooms,
+            "cars": car_spaces,
+            "bedroom_to_land_ratio": 0 if is_unit else beds / max(effective_land_size, 1),
+            "bathroom_to_bedroom_ratio": bathrooms / max(beds, 1),
+            "suburb_castle_hill": 1 if "CASTLE" in suburb.upper() else 0,
+            "property_type_house": 1 if prop_type == "house" else 0,
+            "property_type_unit": 1 if prop_type == "unit" else 0,
+            "property_type_townhouse": 1 if prop_type == "townhouse" else 0,
+            "is_house_large_land": (
+                1 if prop_type == "house" and effective_land_size > 500 and has_real_land_size else 0
+            ),
+            "has_real_land_size": has_real_land_size,
+            "is_spring": 1 if sale_month in [9, 10, 11] else 0,
+            "is_summer": 1 if sale_month in [12, 1, 2] else 0,
+            "is_autumn": 1 if sale_month in [3, 4, 5] else 0,
+            "is_winter": 1 if sale_month in [6, 7, 8] else 0,
+            "years_since_sale": 0,
+            "rolling_avg_price_per_m2": rolling_avg_price_per_m2,
+        }
+
+        input_features = {
+            "land_size": land_size,
+            "land_size_used": effective_land_size,
+            "has_real_land_size": bool(has_real_land_size),
+            "beds": beds,
+            "bathrooms": bathrooms,
+            "car_spaces": car_spaces,
+            "suburb": suburb,
+            "property_type": property_type,
+            "property_type_consolidated": prop_type,
+        }
+
+        return features, input_features
+
+    def _format_prediction(self, predicted_price: float, input_features: Dict) -> Dict:
+        """Wrap a raw model output with its confidence range and inputs."""
+        # Confidence range
+        mape = self.metadata.get("metrics", {}).get("mape", 15)
+        margin = predicted_price * (mape / 100)
+
+        # Add confidence note for units without land size
+        confidence_note = None
+        if input_features["property_type_consolidated"] == "unit":
+            confidence_note = "Land size not applicable for units"
+        elif not input_features["has_real_land_size"]:
+            confidence_note = f"Using imputed land size ({input_features['land_size_used']}m²)"
+
+        return {
+            "predicted_price": round(predicted_price, -3),
+            "price_range_low": round(predicted_price - margin, -3),
+            "price_range_high": round(predicted_price + margin, -3),
+            "confidence_level": f"Based on MAPE: {mape:.1f}%",
+            "confidence_note": confidence_note,
+            "input_features": input_features,
+        }
+
     def predict(
         self,
         land_size: float = None,
@@ -412,58 +631,16 @@ class PropertyValuationModel:
                 raise ModelNotFoundError(str(self.model_path))
 
         try:
-            # Consolidate property type
-            prop_type = consolidate_property_type(property_type)
-            is_unit = prop_type == "unit"
-
-            # Handle land size
-            if is_unit:
-                effective_land_size = 0
-                has_real_land_size = 0
-            else:
-                if land_size and land_size > 0:
-                    effective_land_size = land_size
-                    has_real_land_size = 1
-                else:
-                    effective_land_size = get_default_land_size(prop_type)
-                    has_real_land_size = 0
-
-            # Default sale month
-            if sale_month is None:
-                sale_month = datetime.now().month
-
-            # Default rolling average
-            if rolling_avg_price_per_m2 is None:
-                if self.metadata and "median_values" in self.metadata:
-                    rolling_avg_price_per_m2 = self.metadata["median_values"].get(
-                        "rolling_avg_price_per_m2", 10000
-                    )
-                else:
-                    rolling_avg_price_per_m2 = 10000
-
-            # Build feature vector
-            features = {
-                "land_size_numeric": effective_land_size,
-                "beds": beds,
-                "baths": bathrooms,
-                "cars": car_spaces,
-                "bedroom_to_land_ratio": 0 if is_unit else beds / max(effective_land_size, 1),
-                "bathroom_to_bedroom_ratio": bathrooms / max(beds, 1),
-                "suburb_castle_hill": 1 if "CASTLE" in suburb.upper() else 0,
-                "property_type_house": 1 if prop_type == "house" else 0,
-                "property_type_unit": 1 if prop_type == "unit" else 0,
-                "property_type_townhouse": 1 if prop_type == "townhouse" else 0,
-                "is_house_large_land": (
-                    1 if prop_type == "house" and effective_land_size > 500 and has_real_land_size else 0
-                ),
-                "has_real_land_size": has_real_land_size,
-                "is_spring": 1 if sale_month in [9, 10, 11] else 0,
-                "is_summer": 1 if sale_month in [12, 1, 2] else 0,
-                "is_autumn": 1 if sale_month in [3, 4, 5] else 0,
-                "is_winter": 1 if sale_month in [6, 7, 8] else 0,
-                "years_since_sale": 0,
-                "rolling_avg_price_per_m2": rolling_avg_price_per_m2,
-            }
+            features, input_features = self._build_features(
+                land_size=land_size,
+                beds=beds,
+                bathrooms=bathrooms,
+                car_spaces=car_spaces,
+                suburb=suburb,
+                property_type=property_type,
+                sale_month=sale_month,
+                rolling_avg_price_per_m2=rolling_avg_price_per_m2,
+            )
 
             # Create DataFrame
             X = pd.DataFrame([features])[FEATURE_COLUMNS]
@@ -471,35 +648,7 @@ class PropertyValuationModel:
             # Predict
             predicted_price = float(self.model.predict(X)[0])
 
-            # Confidence range
-            mape = self.metadata.get("metrics", {}).get("mape", 15)
-            margin = predicted_price * (mape / 100)
-
-            # Add confidence note for units without land size
-            confidence_note = None
-            if is_unit:
-                confidence_note = "Land size not applicable for units"
-            elif not has_real_land_size:
-                confidence_note = f"Using imputed land size ({effective_land_size}m²)"
-
-            return {
-                "predicted_price": round(predicted_price, -3),
-                "price_range_low": round(predicted_price - margin, -3),
-                "price_range_high": round(predicted_price + margin, -3),
-                "confidence_level": f"Based on MAPE: {mape:.1f}%",
-                "confidence_note": confidence_note,
-                "input_features": {
-                    "land_size": land_size,
-                    "land_size_used": effective_land_size,
-                    "has_real_land_size": bool(has_real_land_size),
-                    "beds": beds,
-                    "bathrooms": bathrooms,
-                    "car_spaces": car_spaces,
-                    "suburb": suburb,
-                    "property_type": property_type,
-                    "property_type_consolidated": prop_type,
-                },
-            }
+            return self._format_prediction(predicted_price, input_features)
 
         except Exception as e:
             logger.error("Prediction failed: %s", e, exc_info=True)
@@ -508,19 +657,51 @@ class PropertyValuationModel:
     def predict_batch(self, properties: List[Dict]) -> List[Dict]:
         """Predict values for multiple properties.
 
+        Feature rows are built per property, then scored with a single model
+        call; XGBoost parallelizes prediction across rows internally.
+
         Args:
             properties: List of property dictionaries.
 
         Returns:
-            List of prediction results.
+            List of prediction results, in input order. Properties that could
+            not be predicted get an ``{"error", "input"}`` entry instead.
         """
-        results = []
-        for prop in properties:
+        if self.model is None and not self.load():
+            error = str(ModelNotFoundError(str(self.model_path)))
+            return [{"error": error, "input": prop} for prop in properties]
+
+        results: List[Optional[Dict]] = [None] * len(properties)
+        rows = []
+        row_inputs = []
+        positions = []
+        for idx, prop in enumerate(properties):
             try:
-                result = self.predict(**prop)
-                results.append(result)
+                features, input_features = self._build_features(**prop)
             except Exception as e:
-                results.append({"error": str(e), "input": prop})
+                results[idx] = {"error": str(e), "input": prop}
+                continue
+            rows.append(features)
+            row_inputs.append(input_features)
+            positions.append(idx)
+
+        if rows:
+            try:
+                X = pd.DataFrame(rows)[FEATURE_COLUMNS]
+                predicted = self.model.predict(X)
+            except Exception as e:
+                # Score rows one at a time so a bad row only fails itself
+                logger.warning("Batch prediction failed, predicting rows individually: %s", e)
+                for idx in positions:
+                    try:
+                        results[idx] = self.predict(**properties[idx])
+                    except Exception as row_error:
+                        results[idx] = {"error": str(row_error), "input": properties[idx]}
+                return results
+
+            for idx, price, input_features in zip(positions, predicted, row_inputs):
+                results[idx] = self._format_prediction(float(price), input_features)
+
         return results
 
     def predict_all_listings(self, db_path: str = None, status: str = "sale") -> Tuple[List[Dict], Dict]:
@@ -544,19 +725,27 @@ class PropertyValuationModel:
         conn = sqlite3.connect(db_path)
         conn.row_factory = sqlite3.Row
 
+        # Latest history row per property for the requested status (served by
+        # idx_lh_status_pid_date, see migrations/add_listing_history_status_index.sql)
         query = """
             SELECT h.property_id, p.suburb, h.beds, h.baths, h.cars, h.land_size, h.property_type
-            FROM listing_history h
+            FROM (
+                SELECT property_id, beds, baths, cars, land_size, property_type,
+                       ROW_NUMBER() OVER (PARTITION BY property_id ORDER BY date DESC) AS rn
+                FROM listing_history
+                WHERE status = ?
+            ) h
             JOIN properties p ON h.property_id = p.property_id
-            WHERE h.status = ?
-            AND h.date = (SELECT MAX(date) FROM listing_history WHERE property_id = h.property_id AND status = ?)
+            WHERE h.rn = 1
         """
-        listings = [dict(row) for row in conn.execute(query, (status, status)).fetchall()]
+        listings = [dict(row) for row in conn.execute(query, (status,)).fetchall()]
 
         predictions = []
         success_count = 0
         error_count = 0
 
+        batch_listings = []
+        batch_params = []
         for listing in listings:
             try:
                 land_size_val = parse_land_size(listing.get("land_size"))
@@ -569,20 +758,26 @@ class PropertyValuationModel:
                     "suburb": listing.get("suburb", "CASTLE HILL"),
                     "property_type": listing.get("property_type", "house"),
                 }
-
-                result = self.predict(**params)
-
-                predictions.append({
-                    "property_id": listing["property_id"],
-                    "predicted_price": int(result["predicted_price"]),
-                    "price_range_low": int(result["price_range_low"]),
-                    "price_range_high": int(result["price_range_high"]),
-                })
-                success_count += 1
-
             except Exception as e:
                 error_count += 1
                 logger.warning("Error predicting %s: %s", listing.get("property_id"), e)
+                continue
+            batch_listings.append(listing)
+            batch_params.append(params)
+
+        for listing, result in zip(batch_listings, self.predict_batch(batch_params)):
+            if "error" in result:
+                error_count += 1
+                logger.warning("Error predicting %s: %s", listing.get("property_id"), result["error"])
+                continue
+
+            predictions.append({
+                "property_id": listing["property_id"],
+                "predicted_price": int(result["predicted_price"]),
+                "price_range_low": int(result["price_range_low"]),
+                "price_range_high": int(result["price_range_high"]),
+            })
+            success_count += 1
 
         # Save predictions
         model_version = self.metadata.get("trained_at", "unknown")
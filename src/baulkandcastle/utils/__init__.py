@@ -6,14 +6,18 @@ Provides unified implementations for common parsing operations.
 
 from baulkandcastle.utils.date_parser import (
     parse_date,
+    parse_date_series,
     parse_to_iso,
     parse_snapshot_date,
 )
 from baulkandcastle.utils.price_parser import (
     parse_price,
     extract_price_value,
+    extract_price_series,
     format_price,
+    calculate_price_per_sqm_batch,
 )
+from baulkandcastle.utils.parse_cache import persistent_parse_cache
 from baulkandcastle.utils.property_types import (
     consolidate_property_type,
     is_unit_type,
@@ -23,11 +27,15 @@ from baulkandcastle.utils.property_types import (
 
 __all__ = [
     "parse_date",
+    "parse_date_series",
     "parse_to_iso",
     "parse_snapshot_date",
     "parse_price",
     "extract_price_value",
+    "extract_price_series",
     "format_price",
+    "calculate_price_per_sqm_batch",
+    "persistent_parse_cache",
     "consolidate_property_type",
     "is_unit_type",
     "is_house_type",
@@ -9,17 +9,23 @@ Consolidates date parsing logic from:
 Provides consistent date handling across all modules.
 """
 
+import calendar
 import re
+import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Union
 
+import pandas as pd
+
 from baulkandcastle.exceptions import ParsingError
 from baulkandcastle.logging_config import get_logger
+from baulkandcastle.utils.parse_cache import persistent
 
 logger = get_logger(__name__)
 
 # Common date format patterns
-DATE_PATTERNS = [
+_RAW_DATE_PATTERNS = [
     # ISO format: 2024-01-15
     (r"^\d{4}-\d{2}-\d{2}$", "%Y-%m-%d"),
     # ISO with time: 2024-01-15T10:30:00
@@ -36,6 +42,92 @@ DATE_PATTERNS = [
     (r"^\d{1,2}[A-Za-z]{3}\d{4}$", "%d%b%Y"),
 ]
 
+# Compiled once at import so parse_date never goes through re's pattern cache
+DATE_PATTERNS = [(re.compile(p, re.IGNORECASE), fmt) for p, fmt in _RAW_DATE_PATTERNS]
+
+# All patterns as one alternation: a single match() picks the first pattern
+# that fits and lastgroup names its format
+_DATE_SHAPE_RE = re.compile(
+    "|".join(f"(?P<p{i}>{p})" for i, (p, _) in enumerate(_RAW_DATE_PATTERNS)),
+    re.IGNORECASE,
+)
+_DATE_SHAPE_FORMATS = {f"p{i}": fmt for i, (_, fmt) in enumerate(_RAW_DATE_PATTERNS)}
+
+# Month name tables for hand parsing (strptime %b / %B, case-insensitive)
+_MONTH_ABBR = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_MONTH_FULL = {
+    "january": 1, "february": 2, "march": 3, "april": 4, "may": 5, "june": 6,
+    "july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12,
+}
+_FAST_MONTHS = {**_MONTH_ABBR, **_MONTH_FULL}
+
+# Formats tried by parse_date when no pattern above matched
+_FALLBACK_DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%d %b %Y",
+    "%d %B %Y",
+    "%b %Y",
+    "%d-%m-%Y",
+]
+
+# Fallback formats keyed by their separator. No month name contains "-" or
+# "/", so a string can only satisfy the formats for the first of "-", "/"
+# it contains (else the space formats), in the same order as above.
+_FALLBACK_BY_SEPARATOR = {
+    sep: tuple(fmt for fmt in _FALLBACK_DATE_FORMATS if sep in fmt) for sep in "-/ "
+}
+
+# Formats tried in turn by parse_date_series before the scalar fallback
+_SERIES_DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%d %b %Y",
+    "%d %B %Y",
+    "%b %Y",
+    "%d%b%Y",
+    "%d-%m-%Y",
+]
+
+# strptime looks its format regex up in a lock-protected cache on every call;
+# compile the handful we use once. _strptime is CPython's implementation
+# module, so fall back to plain strptime if it is missing.
+try:
+    from _strptime import TimeRE
+
+    _TIME_RE = TimeRE()
+    _COMPILED_FORMATS = {
+        fmt: _TIME_RE.compile(fmt)
+        for fmt in {fmt for _, fmt in _RAW_DATE_PATTERNS} | set(_FALLBACK_DATE_FORMATS)
+    }
+except ImportError:
+    _COMPILED_FORMATS = {}
+
+# Leading label on Domain snapshot dates ("Estimated Jan 2024")
+_SNAPSHOT_PREFIX_RE = re.compile(r"^\s*(?:estimated|as at|last updated|updated)\s*", re.IGNORECASE)
+
+# Australian season by month (index month - 1)
+_SEASONS = tuple(
+    sys.intern(season)
+    for season in (
+        "summer", "summer",
+        "autumn", "autumn", "autumn",
+        "winter", "winter", "winter",
+        "spring", "spring", "spring",
+        "summer",
+    )
+)
+
+# Bound on memoized parse results; scraped data repeats the same dates heavily
+_PARSE_CACHE_SIZE = 32768
+
+# Version of parse_to_iso results in the persistent parse cache; bump it
+# whenever a change here alters what a date string parses to
+_ISO_PARSE_VERSION = 1
+
 
 def parse_date(date_str: Union[str, None]) -> Optional[datetime]:
     """Parse a date string into a datetime object.
@@ -66,34 +158,118 @@ def parse_date(date_str: Union[str, None]) -> Optional[datetime]:
     if not date_str:
         return None
 
+    return _parse_date_cached(date_str)
+
+
+def _fast_parse(date_str: str) -> Optional[datetime]:
+    """Parse the common date shapes without regex or strptime.
+
+    Recognises "YYYY-MM-DD", "DD/MM/YYYY", "D Mon YYYY" / "D Month YYYY",
+    "Mon YYYY" and "DMonYYYY" by length, separator position and the month
+    name tables. Returns None on anything else
+    (including invalid dates) so the caller can fall back to the full parser.
+
+    This stays plain Python on purpose: a Numba kernel over the encoded bytes
+    is slower per call once the str -> bytes -> array conversion is counted,
+    and bulk parsing already goes through parse_date_series.
+    """
+    try:
+        if len(date_str) == 10:
+            if date_str[4] == "-" and date_str[7] == "-":
+                year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+            elif date_str[2] == "/" and date_str[5] == "/":
+                day, month, year = date_str[:2], date_str[3:5], date_str[6:]
+            else:
+                year = None
+            if year is not None and year.isdigit() and month.isdigit() and day.isdigit():
+                return datetime(int(year), int(month), int(day))
+
+        parts = date_str.split()
+        if len(parts) == 3:
+            day, month_name, year = parts
+            month = _FAST_MONTHS.get(month_name.lower())
+            if (
+                month is not None
+                and len(day) <= 2 and day.isdigit()
+                and len(year) == 4 and year.isdigit()
+            ):
+                return datetime(int(year), month, int(day))
+        elif len(parts) == 2:
+            month_name, year = parts
+            month = _MONTH_ABBR.get(month_name.lower())
+            if month is not None and len(year) == 4 and year.isdigit():
+                return datetime(int(year), month, 1)
+        elif len(date_str) in (8, 9):
+            day, month_name, year = date_str[:-7], date_str[-7:-4], date_str[-4:]
+            month = _MONTH_ABBR.get(month_name.lower())
+            if month is not None and day.isdigit() and year.isdigit():
+                return datetime(int(year), month, int(day))
+    except ValueError:
+        pass
+    return None
+
+
+def _fast_strptime(date_str: str, fmt: str) -> datetime:
+    """datetime.strptime for our date formats, using precompiled regexes.
+
+    Raises:
+        ValueError: If date_str does not match fmt or is not a valid date.
+    """
+    compiled = _COMPILED_FORMATS.get(fmt)
+    if compiled is None:
+        return datetime.strptime(date_str, fmt)
+
+    match = compiled.match(date_str)
+    if match is None or match.end() != len(date_str):
+        raise ValueError(f"time data {date_str!r} does not match format {fmt!r}")
+
+    fields = match.groupdict()
+    month_name = fields.get("b") or fields.get("B")
+    if month_name:
+        month = _FAST_MONTHS.get(month_name.lower())
+        if month is None:
+            # Non-English locale month name: let strptime resolve it
+            return datetime.strptime(date_str, fmt)
+    else:
+        month = int(fields.get("m") or 1)
+
+    return datetime(
+        int(fields["Y"]),
+        month,
+        int(fields.get("d") or 1),
+        int(fields.get("H") or 0),
+        int(fields.get("M") or 0),
+        int(fields.get("S") or 0),
+    )
+
+
+def _parse_date_uncached(date_str: str) -> Optional[datetime]:
+    """Parse a non-empty, stripped date string."""
+    dt = _fast_parse(date_str)
+    if dt is not None:
+        return dt
+
     # Handle ISO format with time component
     if "T" in date_str:
         date_str = date_str.split("T")[0]
         try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
+            return _fast_strptime(date_str, "%Y-%m-%d")
         except ValueError:
             pass
 
-    # Try each pattern
-    for pattern, fmt in DATE_PATTERNS:
-        if re.match(pattern, date_str, re.IGNORECASE):
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-
-    # Last resort: try common patterns without regex matching
-    fallback_formats = [
-        "%Y-%m-%d",
-        "%d/%m/%Y",
-        "%d %b %Y",
-        "%d %B %Y",
-        "%b %Y",
-        "%d-%m-%Y",
-    ]
-    for fmt in fallback_formats:
+    # Try the format of the first pattern that fits
+    shape = _DATE_SHAPE_RE.match(date_str)
+    if shape:
         try:
-            return datetime.strptime(date_str, fmt)
+            return _fast_strptime(date_str, _DATE_SHAPE_FORMATS[shape.lastgroup])
+        except ValueError:
+            pass
+
+    # Last resort: try the common patterns that share its separator
+    sep = "-" if "-" in date_str else "/" if "/" in date_str else " "
+    for fmt in _FALLBACK_BY_SEPARATOR[sep]:
+        try:
+            return _fast_strptime(date_str, fmt)
         except ValueError:
             continue
 
@@ -101,6 +277,48 @@ def parse_date(date_str: Union[str, None]) -> Optional[datetime]:
     return None
 
 
+_parse_date_cached = lru_cache(maxsize=_PARSE_CACHE_SIZE)(_parse_date_uncached)
+
+
+def parse_date_series(dates: pd.Series) -> pd.Series:
+    """Parse a Series of date strings in bulk.
+
+    Vectorized counterpart of parse_date: each known format is applied to the
+    still-unparsed rows with pd.to_datetime, and only rows no format matched
+    go through parse_date one by one.
+
+    Args:
+        dates: Series of date strings (None/NaN allowed).
+
+    Returns:
+        datetime64 Series aligned with dates, NaT where parsing fails.
+
+    Example:
+        >>> parse_date_series(pd.Series(["2024-01-15", "15 Jan 2024", None])).tolist()
+        [Timestamp('2024-01-15'), Timestamp('2024-01-15'), NaT]
+    """
+    text = dates.astype("string").str.strip()
+    # Drop the time part of ISO timestamps
+    text = text.str.replace(r"^(\d{4}-\d{2}-\d{2})T.*$", r"\1", regex=True)
+
+    result = pd.Series(pd.NaT, index=dates.index, dtype="datetime64[ns]")
+    pending = (text.notna() & (text != "")).to_numpy(dtype=bool)
+
+    for fmt in _SERIES_DATE_FORMATS:
+        if not pending.any():
+            break
+        parsed = pd.to_datetime(text[pending], format=fmt, errors="coerce", cache=True)
+        result[pending] = parsed
+        pending &= result.isna().to_numpy()
+
+    if pending.any():
+        result[pending] = pd.to_datetime(
+            dates[pending].map(parse_date, na_action="ignore"), errors="coerce"
+        )
+
+    return result
+
+
 def parse_to_iso(date_str: Union[str, None]) -> Optional[str]:
     """Parse a date string and return ISO format (YYYY-MM-DD).
 
@@ -114,6 +332,28 @@ def parse_to_iso(date_str: Union[str, None]) -> Optional[str]:
         >>> parse_to_iso("15 Jan 2024")
         "2024-01-15"
     """
+    if not date_str:
+        return None
+
+    return _parse_to_iso_cached(str(date_str).strip())
+
+
+@persistent("iso", version=_ISO_PARSE_VERSION, maxsize=_PARSE_CACHE_SIZE)
+def _parse_to_iso_cached(date_str: str) -> Optional[str]:
+    """Memoized body of parse_to_iso for a stripped date string."""
+    # Already ISO (optionally with a time part): return the date slice as-is
+    head = date_str[:10]
+    if (
+        len(head) == 10
+        and (len(date_str) == 10 or date_str[10] == "T")
+        and head[4] == "-" and head[7] == "-"
+        and head.isascii()
+        and head[:4].isdigit() and head[5:7].isdigit() and head[8:].isdigit()
+    ):
+        year, month, day = int(head[:4]), int(head[5:7]), int(head[8:])
+        if year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
+            return head
+
     dt = parse_date(date_str)
     if dt:
         return dt.strftime("%Y-%m-%d")
@@ -141,12 +381,14 @@ def parse_snapshot_date(snapshot_text: str) -> Optional[str]:
     if not snapshot_text:
         return None
 
-    # Remove common prefixes
-    text = snapshot_text.lower()
-    for prefix in ["estimated", "as at", "updated", "last updated"]:
-        text = text.replace(prefix, "").strip()
+    return _parse_snapshot_date_cached(snapshot_text)
 
-    # Try to parse what remains
+
+@lru_cache(maxsize=4096)
+def _parse_snapshot_date_cached(snapshot_text: str) -> Optional[str]:
+    """Memoized body of parse_snapshot_date."""
+    # Remove the leading label and parse what remains
+    text = _SNAPSHOT_PREFIX_RE.sub("", snapshot_text, count=1)
     return parse_to_iso(text.strip())
 
 
@@ -187,7 +429,23 @@ def days_between(date1: Union[str, datetime], date2: Union[str, datetime]) -> Op
     if date1 is None or date2 is None:
         return None
 
-    return abs((date2 - date1).days)
+    return days_between_dt(date1, date2)
+
+
+def days_between_dt(date1: datetime, date2: datetime) -> int:
+    """Calculate whole days between two datetimes, in either order.
+
+    Fast path for callers that already hold datetime objects: no parsing
+    or None checks.
+
+    Args:
+        date1: First datetime.
+        date2: Second datetime.
+
+    Returns:
+        Number of whole days between the two.
+    """
+    return (date2 - date1).days if date2 >= date1 else (date1 - date2).days
 
 
 def get_season(dt: datetime) -> str:
@@ -205,15 +463,7 @@ def get_season(dt: datetime) -> str:
     Returns:
         Season name ("summer", "autumn", "winter", "spring").
     """
-    month = dt.month
-    if month in (12, 1, 2):
-        return "summer"
-    elif month in (3, 4, 5):
-        return "autumn"
-    elif month in (6, 7, 8):
-        return "winter"
-    else:
-        return "spring"
+    return _SEASONS[dt.month - 1]
 
 
 def years_since(date_str: Union[str, datetime], reference: datetime = None) -> Optional[float]:
@@ -0,0 +1,110 @@
+"""
+Persistent Parse Cache
+
+Keeps parse_to_iso() and extract_price_value() results on disk so repeated
+scraping or training runs over the same data skip re-parsing.
+
+Usage:
+    from baulkandcastle.utils.parse_cache import persistent_parse_cache
+
+    with persistent_parse_cache("data/.cache/parse"):
+        run_scrape()
+
+An in-process lru_cache sits in front of the disk store, so each distinct
+string touches disk at most once per block. It is cleared when the block
+is entered and left: strings memoized earlier still reach the store, and
+values loaded from disk do not outlive the block. Keys carry the parser's
+version, so bumping it after a parser fix retires the old results. The
+store is a shelve file and is meant for one process at a time.
+"""
+
+import shelve
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, TypeVar, Union
+
+from baulkandcastle.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Open store while inside persistent_parse_cache(), else None
+_store: Optional[shelve.Shelf] = None
+
+# lru_cache-wrapped parsers, cleared whenever the store is opened or closed
+_memoized: List[Callable] = []
+
+
+def persistent(
+    kind: str, version: int, maxsize: int
+) -> Callable[[Callable[[str], T]], Callable[[str], T]]:
+    """Memoize a single-string parser, backed by the open persistent store.
+
+    Args:
+        kind: Namespace for this parser's keys (e.g. "iso", "price").
+        version: Parser version; bump it whenever the parser's results change.
+        maxsize: Size of the in-process lru_cache in front of the store.
+
+    Returns:
+        Decorator producing an lru_cache-wrapped parser; without an open store
+        the parser is only memoized in process.
+    """
+    prefix = f"{kind}:v{version}\0"
+
+    def decorator(func: Callable[[str], T]) -> Callable[[str], T]:
+        @wraps(func)
+        def wrapper(text: str) -> T:
+            store = _store
+            if store is None:
+                return func(text)
+
+            key = prefix + text
+            try:
+                return store[key]
+            except KeyError:
+                result = func(text)
+                store[key] = result
+                return result
+
+        memoized = lru_cache(maxsize=maxsize)(wrapper)
+        _memoized.append(memoized)
+        return memoized
+
+    return decorator
+
+
+def _clear_memoized() -> None:
+    """Drop in-process results so the store decides what the next call sees."""
+    for func in _memoized:
+        func.cache_clear()
+
+
+@contextmanager
+def persistent_parse_cache(path: Union[str, Path]) -> Iterator[None]:
+    """Back the parse caches with a shelve file for the duration of the block.
+
+    Nested uses share the store opened by the outermost one.
+
+    Args:
+        path: Shelve file path (parent directories are created).
+    """
+    global _store
+
+    if _store is not None:
+        yield
+        return
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with shelve.open(str(path)) as store:
+        _clear_memoized()
+        _store = store
+        logger.debug("Opened persistent parse cache at %s (%d entries)", path, len(store))
+        try:
+            yield
+        finally:
+            _store = None
+            _clear_memoized()
@@ -9,12 +9,61 @@ Provides consistent price handling across all modules.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 
+import numpy as np
+import pandas as pd
+
 from baulkandcastle.logging_config import get_logger
+from baulkandcastle.utils.parse_cache import persistent
 
 logger = get_logger(__name__)
 
+# Price patterns, compiled once at import
+_SKIP_RE = re.compile(r'auction|contact|expression|eoi|offers', re.IGNORECASE)
+
+# Whole price texts that carry no number (lowercased), answered without
+# running any pattern
+_NON_PRICE = frozenset({"auction", "contact agent", "expressions of interest", "eoi"})
+
+# Skip words by first character, for price text that opens with one
+# ("Contact Agent", "Auction")
+_SKIP_PREFIXES = {
+    "a": ("auction",),
+    "c": ("contact",),
+    "e": ("expression", "eoi"),
+    "o": ("offers",),
+}
+
+# One price token: a number with an optional m/k multiplier ("1.5M", "500k",
+# "1.2 million"), optionally followed by the upper end of a range
+_SUFFIX = r'(?:m(?:m|il(?:lion)?|n)?s?|k)(?![a-z])'
+_PRICE_RE = re.compile(
+    rf'\$?(?P<num>\d[\d,]*(?:\.\d+)?)\s*(?P<suf>{_SUFFIX})?'
+    rf'(?:\s*(?:[-–—]|to)\s*\$?(?P<num2>\d[\d,]*(?:\.\d+)?)\s*(?P<suf2>{_SUFFIX})?)?',
+    re.IGNORECASE,
+)
+_MULT = {"m": 1_000_000, "k": 1_000}
+
+# Bound on memoized parse results; scraped price and land strings repeat heavily
+_PARSE_CACHE_SIZE = 8192
+
+# Version of extract_price_value results in the persistent parse cache; bump
+# it whenever a change here alters what a price string parses to
+_PRICE_PARSE_VERSION = 1
+
+_RANGE_PATTERNS = [
+    re.compile(
+        r'\$?([\d,]+(?:\.\d+)?[mMkK]?)\s*[-–—to]+\s*\$?([\d,]+(?:\.\d+)?[mMkK]?)',
+        re.IGNORECASE,
+    ),
+    re.compile(r'from\s*\$?([\d,]+(?:\.\d+)?[mMkK]?)', re.IGNORECASE),
+]
+_RE_DECIMAL = re.compile(r'([\d,]+(?:\.\d+)?)')
+_RE_DIGITS = re.compile(r'([\d,]+)')
+_RE_LAND_SIZE = re.compile(r'(\d+(?:\.\d+)?)')
+
 
 def extract_price_value(price_str: Union[str, None]) -> Optional[int]:
     """Extract numeric price value from a price string.
@@ -48,47 +97,131 @@ def extract_price_value(price_str: Union[str, None]) -> Optional[int]:
     if not price_str:
         return None
 
-    # Skip non-numeric indicators
-    lower_str = price_str.lower()
-    if any(skip in lower_str for skip in ["auction", "contact", "expression", "eoi", "offers"]):
+    return _extract_price_value_cached(price_str)
+
+
+@persistent("price", version=_PRICE_PARSE_VERSION, maxsize=_PARSE_CACHE_SIZE)
+def _extract_price_value_cached(price_str: str) -> Optional[int]:
+    """Memoized body of extract_price_value for a stripped price string."""
+    # Bare "$1,500,000" / "$1.5M" strings hold no words; read them directly
+    body = price_str[1:] if price_str[0] == "$" else price_str
+    if body[:1].isdigit():
+        mult = _MULT.get(body[-1:].lower())
+        if mult is not None:
+            body = body[:-1]
+        whole, dot, frac = body.partition(".")
+        whole = whole.replace(",", "")
+        if (
+            whole.isascii() and whole.isdigit()
+            and (not dot or (frac.isascii() and frac.isdigit()))
+        ):
+            return _token_price(whole, frac, mult)
+
+    # Skip non-numeric indicators, checking the opening word before scanning
+    prefixes = _SKIP_PREFIXES.get(price_str[0].lower())
+    if prefixes is not None and price_str[:10].lower().startswith(prefixes):
+        return None
+    if _SKIP_RE.search(price_str):
         return None
 
-    # Handle millions shorthand (e.g., "$1.5M")
-    million_match = re.search(r'\$?(\d+(?:\.\d+)?)\s*[mM]', price_str)
-    if million_match:
-        value = float(million_match.group(1))
-        return int(value * 1_000_000)
-
-    # Handle thousands shorthand (e.g., "$500K")
-    thousand_match = re.search(r'\$?(\d+(?:\.\d+)?)\s*[kK]', price_str)
-    if thousand_match:
-        value = float(thousand_match.group(1))
-        return int(value * 1_000)
-
-    # For ranges, extract the first number (lower bound)
-    # "$1,500,000 - $1,700,000" -> 1500000
-    range_match = re.search(r'\$?([\d,]+)\s*[-–—]\s*\$?([\d,]+)', price_str)
-    if range_match:
-        try:
-            return int(range_match.group(1).replace(",", ""))
-        except ValueError:
-            pass
-
-    # Extract any numeric value with optional dollar sign and commas
-    numeric_match = re.search(r'\$?([\d,]+)', price_str)
-    if numeric_match:
-        try:
-            value = int(numeric_match.group(1).replace(",", ""))
-            # Sanity check: ignore values that are clearly not prices
-            if value >= 10_000:
-                return value
-        except ValueError:
-            pass
+    # Take the first token that reads as a price. Shorthand ("$1.5M",
+    # "$500K") is scaled; for ranges the lower bound is used and picks up the
+    # upper bound's multiplier ("1.5-1.7M"). Bare numbers under 10,000 are
+    # ignored as clearly not prices.
+    for match in _PRICE_RE.finditer(price_str):
+        whole, _, frac = match["num"].replace(",", "").partition(".")
+        suffix = match["suf"] or match["suf2"]
+        price = _token_price(whole, frac, None if suffix is None else _MULT[suffix[0].lower()])
+        if price is not None:
+            return price
 
     logger.debug("Could not extract price from: %s", price_str)
     return None
 
 
+def _token_price(whole: str, frac: str, mult: Optional[int]) -> Optional[int]:
+    """Price for one number token split at its decimal point, or None.
+
+    Shorthand is scaled by mult with integer arithmetic, so "2.01" x 1M is
+    exactly 2,010,000. Bare numbers under 10,000 do not read as prices.
+    """
+    value = int(whole)
+    if mult is not None and value < 10_000:
+        return int(whole + frac) * mult // 10 ** len(frac)
+    if value >= 10_000:
+        return value
+    return None
+
+
+def _scale_number(number: str, mult: int) -> int:
+    """Scale a "1,234.5" style number by mult using integer arithmetic."""
+    whole, _, frac = number.replace(",", "").partition(".")
+    return int(whole + frac) * mult // 10 ** len(frac)
+
+
+def extract_price_series(prices: pd.Series) -> pd.Series:
+    """Extract numeric prices from a Series of price strings in bulk.
+
+    Vectorized counterpart of extract_price_value: every price token is
+    extracted with Series.str.extractall and the first one that reads as a
+    price is kept per row.
+
+    Args:
+        prices: Series of price strings (None/NaN allowed).
+
+    Returns:
+        Nullable Int64 Series aligned with prices, <NA> where no price found.
+
+    Example:
+        >>> extract_price_series(pd.Series(["$1.5M", "$500K", "Auction"])).tolist()
+        [1500000, 500000, <NA>]
+    """
+    text = prices.astype("string").str.strip().astype(object).reset_index(drop=True)
+
+    tokens = text.str.extractall(_PRICE_RE)
+    if tokens.empty:
+        return pd.Series(pd.NA, index=prices.index, dtype="Int64")
+
+    # Non-ASCII digits ("１,５００") are left to the scalar parser, per row
+    unusual = tokens["num"].str.contains(r"[^0-9,.]", regex=True)
+    fallback_rows = tokens.index[unusual.to_numpy(dtype=bool)].unique(level=0)
+    tokens = tokens[~unusual]
+
+    result = pd.Series(np.nan, index=text.index)
+    if not tokens.empty:
+        parts = tokens["num"].str.replace(",", "", regex=False).str.partition(".")
+        value = pd.to_numeric(parts[0]).astype(float)
+        suffix = (
+            tokens["suf"].astype("string")
+            .fillna(tokens["suf2"].astype("string"))
+            .str[:1]
+            .str.lower()
+        )
+        mult = pd.Series(
+            np.select(
+                [suffix.eq("m").fillna(False).to_numpy(dtype=bool),
+                 suffix.eq("k").fillna(False).to_numpy(dtype=bool)],
+                [float(_MULT["m"]), float(_MULT["k"])],
+                np.nan,
+            ),
+            index=tokens.index,
+        ).where(value < 10_000)
+        # Exact scaling, as in _token_price: digits x mult // 10**decimals
+        digits = pd.to_numeric(parts[0] + parts[2]).astype(float)
+        scaled = np.floor_divide(digits * mult, 10.0 ** parts[2].str.len())
+        candidate = scaled.fillna(value.where(value >= 10_000))
+        first = candidate.dropna().groupby(level=0).first()
+        result = first.reindex(text.index).astype(float)
+
+    skip = text.str.contains(_SKIP_RE, na=False)
+    result = result.mask(skip)
+    for row in fallback_rows:
+        price = extract_price_value(text[row])
+        result[row] = np.nan if price is None else price
+
+    return pd.Series(np.trunc(result.to_numpy()), index=prices.index).astype("Int64")
+
+
 def parse_price(price_str: Union[str, None]) -> Tuple[Optional[int], Optional[int]]:
     """Parse a price string and extract both low and high values.
 
@@ -111,17 +244,12 @@ def parse_price(price_str: Union[str, None]) -> Tuple[Optional[int], Optional[in
         return None, None
 
     price_str = str(price_str).strip()
-    if not price_str:
+    if not price_str or price_str.lower() in _NON_PRICE:
         return None, None
 
     # Check for range pattern
-    range_patterns = [
-        r'\$?([\d,]+(?:\.\d+)?[mMkK]?)\s*[-–—to]+\s*\$?([\d,]+(?:\.\d+)?[mMkK]?)',
-        r'from\s*\$?([\d,]+(?:\.\d+)?[mMkK]?)',
-    ]
-
-    for pattern in range_patterns:
-        match = re.search(pattern, price_str, re.IGNORECASE)
+    for pattern in _RANGE_PATTERNS:
+        match = pattern.search(price_str)
         if match:
             low_str = match.group(1)
             low = _parse_single_value(low_str)
@@ -145,22 +273,25 @@ def parse_price(price_str: Union[str, None]) -> Tuple[Optional[int], Optional[in
     return None, None
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def _parse_single_value(value_str: str) -> Optional[int]:
     """Parse a single price value string."""
+    lowered = value_str.lower()
+
     # Handle millions
-    if re.search(r'[mM]', value_str):
-        num_match = re.search(r'([\d,]+(?:\.\d+)?)', value_str)
+    if "m" in lowered:
+        num_match = _RE_DECIMAL.search(value_str)
         if num_match:
-            return int(float(num_match.group(1).replace(",", "")) * 1_000_000)
+            return _scale_number(num_match.group(1), 1_000_000)
 
     # Handle thousands
-    if re.search(r'[kK]', value_str):
-        num_match = re.search(r'([\d,]+(?:\.\d+)?)', value_str)
+    if "k" in lowered:
+        num_match = _RE_DECIMAL.search(value_str)
         if num_match:
-            return int(float(num_match.group(1).replace(",", "")) * 1_000)
+            return _scale_number(num_match.group(1), 1_000)
 
     # Regular number
-    num_match = re.search(r'([\d,]+)', value_str)
+    num_match = _RE_DIGITS.search(value_str)
     if num_match:
         return int(num_match.group(1).replace(",", ""))
 
@@ -186,23 +317,41 @@ def format_price(price: Union[int, float, None], compact: bool = False) -> str:
     if price is None:
         return "-"
 
-    price = int(price)
+    return _format_price_int(int(price), compact)
 
+
+@lru_cache(maxsize=4096)
+def _format_price_int(price: int, compact: bool) -> str:
+    """Memoized body of format_price for an integer price."""
     if compact:
         if price >= 1_000_000:
-            value = price / 1_000_000
-            if value == int(value):
-                return f"${int(value)}M"
-            return f"${value:.1f}M".rstrip("0").rstrip(".")
+            return _format_compact(price, 1_000_000, "M")
         elif price >= 1_000:
-            value = price / 1_000
-            if value == int(value):
-                return f"${int(value)}K"
-            return f"${value:.1f}K".rstrip("0").rstrip(".")
+            return _format_compact(price, 1_000, "K")
 
     return f"${price:,}"
 
 
+def _format_compact(price: int, unit: int, suffix: str) -> str:
+    """Format price in units of unit, with one decimal unless it divides evenly.
+
+    Uses integer arithmetic; only exact ties at the second decimal go through
+    float formatting so rounding matches f"{value:.1f}".
+    """
+    whole, rest = divmod(price, unit)
+    if rest == 0:
+        return f"${whole}{suffix}"
+
+    scaled = rest * 10
+    if scaled % unit * 2 == unit:
+        return f"${price / unit:.1f}{suffix}"
+
+    tenths = (scaled + unit // 2) // unit
+    if tenths == 10:
+        whole, tenths = whole + 1, 0
+    return f"${whole}.{tenths}{suffix}"
+
+
 def format_price_range(low: Optional[int], high: Optional[int], compact: bool = False) -> str:
     """Format a price range as a string.
 
@@ -258,12 +407,43 @@ def calculate_price_per_sqm(price: Union[int, float, None], land_size: Union[str
     return price / land_size
 
 
+def calculate_price_per_sqm_batch(prices, land_sizes) -> np.ndarray:
+    """Calculate price per square meter for many listings at once.
+
+    Vectorized counterpart of calculate_price_per_sqm: land size strings are
+    parsed with Series.str.extract and the division is done in NumPy.
+
+    Args:
+        prices: Array-like of prices (None/NaN allowed).
+        land_sizes: Array-like of land sizes, numeric or strings like "450m²".
+
+    Returns:
+        Float array aligned with the inputs, NaN where calculation not possible.
+
+    Example:
+        >>> calculate_price_per_sqm_batch([1000000, None], ["500m²", 400]).tolist()
+        [2000.0, nan]
+    """
+    price = pd.to_numeric(pd.Series(prices, dtype=object), errors="coerce").to_numpy(dtype=float)
+    sizes = pd.Series(land_sizes, dtype=object)
+
+    is_text = sizes.map(type).eq(str).to_numpy()
+    size = pd.to_numeric(sizes.mask(is_text), errors="coerce").to_numpy(dtype=float)
+    if is_text.any():
+        parsed = pd.to_numeric(sizes[is_text].str.extract(_RE_LAND_SIZE)[0])
+        size[is_text] = parsed.to_numpy(dtype=float)
+
+    valid = (price > 0) & (size > 0)
+    return np.divide(price, size, out=np.full(len(price), np.nan), where=valid)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def _parse_land_size(land_str: str) -> Optional[float]:
     """Parse land size from string like '450m²' or '450'."""
     if not land_str or land_str.lower() in ("na", "-", ""):
         return None
 
-    match = re.search(r'(\d+(?:\.\d+)?)', str(land_str))
+    match = _RE_LAND_SIZE.search(str(land_str))
     if match:
         value = float(match.group(1))
         return value if value > 0 else None
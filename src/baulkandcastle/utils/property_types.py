@@ -8,7 +8,11 @@ Consolidates property type mapping and validation from:
 Provides consistent property type handling across all modules.
 """
 
-from typing import List, Optional, Set
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Set
 
 from baulkandcastle.logging_config import get_logger
 
@@ -16,7 +20,7 @@ logger = get_logger(__name__)
 
 # Property type consolidation mapping
 # Maps various Domain property types to standardized categories
-PROPERTY_TYPE_MAP = {
+_RAW_PROPERTY_TYPE_MAP = {
     # House types
     "house": "house",
     "free-standing": "house",
@@ -48,9 +52,31 @@ PROPERTY_TYPE_MAP = {
     "retirement": "other",
 }
 
+# Read-only, interned view of the mapping. The is_*_type predicates rely on it
+# covering every alias.
+PROPERTY_TYPE_MAP: Mapping[str, str] = MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _RAW_PROPERTY_TYPE_MAP.items()}
+)
+
+# Matches a "-<type>" URL token followed by "-" or end of string. Alternatives
+# are longest-first so "apartment-unit-flat" wins over "apartment"/"unit".
+_URL_TYPE_RE = re.compile(
+    r"-("
+    + "|".join(sorted(map(re.escape, PROPERTY_TYPE_MAP), key=len, reverse=True))
+    + r")(?=-|$)"
+)
+
 # Consolidated property categories
 PROPERTY_CATEGORIES = {"house", "unit", "townhouse", "other"}
 
+# Imputed land size (m²) by consolidated category
+_DEFAULT_LAND_SIZES: Mapping[str, float] = MappingProxyType({
+    "house": 550.0,  # Average for Baulkham Hills/Castle Hill
+    "townhouse": 250.0,
+    "unit": 0.0,  # Units don't have meaningful land size
+    "other": 400.0,  # Default for unknown types
+})
+
 # Unit types (for land size imputation)
 UNIT_TYPES: Set[str] = {
     "unit",
@@ -81,7 +107,29 @@ TOWNHOUSE_TYPES: Set[str] = {
     "town-house",
 }
 
+# Exact PROPERTY_TYPE_MAP keys, overall and per category. The is_*_type
+# predicates answer canonical keys with set lookups and only send other
+# spellings (case, whitespace, None) through consolidate_property_type.
+_ALL_TYPE_KEYS = frozenset(PROPERTY_TYPE_MAP)
+_UNIT_SET = frozenset(k for k, v in PROPERTY_TYPE_MAP.items() if v == "unit")
+_HOUSE_SET = frozenset(k for k, v in PROPERTY_TYPE_MAP.items() if v == "house")
+_TH_SET = frozenset(k for k, v in PROPERTY_TYPE_MAP.items() if v == "townhouse")
+
+
+def _type_key(prop_type: object) -> str:
+    """Normalise a raw property type into a PROPERTY_TYPE_MAP key.
 
+    Skips str() for str inputs and strip() unless there is edge whitespace.
+    """
+    key = (prop_type if type(prop_type) is str else str(prop_type)).lower()
+    if key[:1].isspace() or key[-1:].isspace():
+        key = key.strip()
+    return key
+
+
+# Shared by the is_*_type predicates and get_default_land_size, so each
+# distinct raw type string is normalised once
+@lru_cache(maxsize=1024)
 def consolidate_property_type(prop_type: Optional[str]) -> str:
     """Map various property types to consolidated categories.
 
@@ -102,8 +150,7 @@ def consolidate_property_type(prop_type: Optional[str]) -> str:
     if not prop_type:
         return "other"
 
-    prop_type_lower = str(prop_type).lower().strip()
-    return PROPERTY_TYPE_MAP.get(prop_type_lower, "other")
+    return PROPERTY_TYPE_MAP.get(_type_key(prop_type), "other")
 
 
 def is_unit_type(prop_type: Optional[str]) -> bool:
@@ -121,11 +168,10 @@ def is_unit_type(prop_type: Optional[str]) -> bool:
         >>> is_unit_type("house")
         False
     """
-    if not prop_type:
-        return False
-
-    prop_type_lower = str(prop_type).lower().strip()
-    return prop_type_lower in UNIT_TYPES or consolidate_property_type(prop_type) == "unit"
+    return prop_type in _UNIT_SET or (
+        prop_type not in _ALL_TYPE_KEYS
+        and consolidate_property_type(prop_type) == "unit"
+    )
 
 
 def is_house_type(prop_type: Optional[str]) -> bool:
@@ -143,11 +189,10 @@ def is_house_type(prop_type: Optional[str]) -> bool:
         >>> is_house_type("apartment")
         False
     """
-    if not prop_type:
-        return False
-
-    prop_type_lower = str(prop_type).lower().strip()
-    return prop_type_lower in HOUSE_TYPES or consolidate_property_type(prop_type) == "house"
+    return prop_type in _HOUSE_SET or (
+        prop_type not in _ALL_TYPE_KEYS
+        and consolidate_property_type(prop_type) == "house"
+    )
 
 
 def is_townhouse_type(prop_type: Optional[str]) -> bool:
@@ -159,13 +204,13 @@ def is_townhouse_type(prop_type: Optional[str]) -> bool:
     Returns:
         True if the property is a townhouse type.
     """
-    if not prop_type:
-        return False
-
-    prop_type_lower = str(prop_type).lower().strip()
-    return prop_type_lower in TOWNHOUSE_TYPES or consolidate_property_type(prop_type) == "townhouse"
+    return prop_type in _TH_SET or (
+        prop_type not in _ALL_TYPE_KEYS
+        and consolidate_property_type(prop_type) == "townhouse"
+    )
 
 
+@lru_cache(maxsize=1024)
 def get_default_land_size(prop_type: Optional[str]) -> float:
     """Get the default imputed land size for a property type.
 
@@ -183,16 +228,7 @@ def get_default_land_size(prop_type: Optional[str]) -> float:
         >>> get_default_land_size("unit")
         0.0
     """
-    consolidated = consolidate_property_type(prop_type)
-
-    if consolidated == "house":
-        return 550.0  # Average for Baulkham Hills/Castle Hill
-    elif consolidated == "townhouse":
-        return 250.0
-    elif consolidated == "unit":
-        return 0.0  # Units don't have meaningful land size
-    else:
-        return 400.0  # Default for unknown types
+    return _DEFAULT_LAND_SIZES[consolidate_property_type(prop_type)]
 
 
 def extract_property_type_from_url(url: str) -> Optional[str]:
@@ -211,14 +247,8 @@ def extract_property_type_from_url(url: str) -> Optional[str]:
     if not url:
         return None
 
-    url_lower = url.lower()
-
-    # Check for property types in URL
-    for prop_type in PROPERTY_TYPE_MAP.keys():
-        if f"-{prop_type}-" in url_lower or url_lower.endswith(f"-{prop_type}"):
-            return prop_type
-
-    return None
+    match = _URL_TYPE_RE.search(url.lower())
+    return match.group(1) if match else None
 
 
 def get_all_property_types() -> List[str]:
@@ -4,14 +4,16 @@ Unit tests for Domain Estimator parsing and database storage.
 Uses the actual snapshot from 4/52-54 Kerrs Road, Castle Hill as the reference test case.
 
 Run tests:
-    python test_domain_estimator.py
     python -m pytest test_domain_estimator.py -v
+    python test_domain_estimator.py            # same full suite via pytest.main
+    python test_domain_estimator.py --quick    # snapshot field checks only
 """
 
 import unittest
 import sqlite3
 import os
 from datetime import datetime
+import pytest
 from domain_estimator_helper import (
     parse_snapshot_text,
     parse_price_string,
@@ -74,6 +76,9 @@ KERRS_ROAD_SNAPSHOT = """
         - text: 8days listed
 """
 
+# The parser is pure, so parse the snapshot once per process
+_PARSED_KERRS = parse_snapshot_text(KERRS_ROAD_SNAPSHOT)
+
 # Expected values from the manual test (what we saved to DB)
 EXPECTED_VALUES = {
     'beds': 3,
@@ -93,6 +98,14 @@ EXPECTED_VALUES = {
 }
 
 
+# Saved domain_estimates row for the snapshot above, compared field by field
+REFERENCE_PROPERTY_ID = '2020510444'
+SAVED_RECORD_FIELDS = ('estimate_low', 'estimate_mid', 'estimate_high', 'beds', 'baths', 'parking')
+SAVED_RECORD_SQL = (
+    f"SELECT {', '.join(SAVED_RECORD_FIELDS)} FROM domain_estimates WHERE property_id = ?"
+)
+
+
 class TestPriceStringParsing(unittest.TestCase):
     """Test the parse_price_string function."""
 
@@ -111,9 +124,14 @@ class TestPriceStringParsing(unittest.TestCase):
         self.assertEqual(parse_price_string('$860k'), 860000)
         self.assertEqual(parse_price_string('$500K'), 500000)
 
+    def test_shorthand_is_exact(self):
+        self.assertEqual(parse_price_string('$2.01m'), 2010000)
+        self.assertEqual(parse_price_string('$32.3k'), 32300)
+
     def test_edge_cases(self):
         self.assertIsNone(parse_price_string(''))
         self.assertIsNone(parse_price_string(None))
+        self.assertIsNone(parse_price_string('$1.2.3m'))
 
 
 class TestAddressToUrl(unittest.TestCase):
@@ -137,108 +155,45 @@ class TestAddressToUrl(unittest.TestCase):
         self.assertEqual(url, 'https://www.domain.com.au/property-profile/15-smith-street-castle-hill-nsw-2154')
 
 
-class TestSnapshotParsing(unittest.TestCase):
-    """Test the parse_snapshot_text function with real data."""
-
-    def setUp(self):
-        self.parsed = parse_snapshot_text(KERRS_ROAD_SNAPSHOT)
-
-    def test_beds_baths_parking(self):
-        self.assertEqual(self.parsed.get('beds'), EXPECTED_VALUES['beds'])
-        self.assertEqual(self.parsed.get('baths'), EXPECTED_VALUES['baths'])
-        self.assertEqual(self.parsed.get('parking'), EXPECTED_VALUES['parking'])
-
-    def test_land_size(self):
-        self.assertEqual(self.parsed.get('land_size'), EXPECTED_VALUES['land_size'])
-
-    def test_property_type(self):
-        self.assertEqual(self.parsed.get('property_type'), EXPECTED_VALUES['property_type'])
-
-    def test_estimate_low(self):
-        self.assertEqual(self.parsed.get('estimate_low'), EXPECTED_VALUES['estimate_low'])
+@pytest.fixture(scope="module")
+def parsed():
+    """Parsed Kerrs Road snapshot."""
+    return _PARSED_KERRS
 
-    def test_estimate_mid(self):
-        self.assertEqual(self.parsed.get('estimate_mid'), EXPECTED_VALUES['estimate_mid'])
 
-    def test_estimate_high(self):
-        self.assertEqual(self.parsed.get('estimate_high'), EXPECTED_VALUES['estimate_high'])
-
-    def test_estimate_accuracy(self):
-        self.assertEqual(self.parsed.get('estimate_accuracy'), EXPECTED_VALUES['estimate_accuracy'])
+@pytest.mark.parametrize("field,expected", list(EXPECTED_VALUES.items()))
+def test_snapshot_field(parsed, field, expected):
+    """Test the parse_snapshot_text function with real data."""
+    assert parsed.get(field) == expected
 
-    def test_rental_weekly(self):
-        self.assertEqual(self.parsed.get('rental_weekly'), EXPECTED_VALUES['rental_weekly'])
 
-    def test_rental_yield(self):
-        self.assertEqual(self.parsed.get('rental_yield'), EXPECTED_VALUES['rental_yield'])
+@pytest.fixture(scope="module")
+def saved_record():
+    """Reference domain_estimates row, queried once for the module.
 
-    def test_last_sold_price(self):
-        # Note: $1.2788m = 1278800
-        self.assertEqual(self.parsed.get('last_sold_price'), EXPECTED_VALUES['last_sold_price'])
+    Skips every test that uses it when the database or record is missing.
+    """
+    if not os.path.exists(DB_PATH):
+        pytest.skip("Reference database not found")
 
-    def test_last_sold_days_listed(self):
-        self.assertEqual(self.parsed.get('last_sold_days_listed'), EXPECTED_VALUES['last_sold_days_listed'])
+    with sqlite3.connect(DB_PATH) as conn:
+        row = conn.execute(SAVED_RECORD_SQL, (REFERENCE_PROPERTY_ID,)).fetchone()
 
-    def test_listing_status(self):
-        self.assertEqual(self.parsed.get('listing_status'), EXPECTED_VALUES['listing_status'])
+    if row is None:
+        pytest.skip("Reference record not found in database")
+    return row
 
 
-class TestDatabaseIntegration(unittest.TestCase):
+class TestDatabaseIntegration:
     """Test that estimates are saved to database correctly."""
 
-    def test_compare_with_saved_record(self):
-        """Compare parsed values with what we manually saved."""
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM domain_estimates WHERE property_id = '2020510444'
-            ''')
-            row = cursor.fetchone()
-
-            if row is None:
-                self.skipTest("Reference record not found in database")
-
-            saved = dict(row)
-
-            # Compare key fields
-            self.assertEqual(saved['estimate_low'], EXPECTED_VALUES['estimate_low'])
-            self.assertEqual(saved['estimate_mid'], EXPECTED_VALUES['estimate_mid'])
-            self.assertEqual(saved['estimate_high'], EXPECTED_VALUES['estimate_high'])
-            self.assertEqual(saved['beds'], EXPECTED_VALUES['beds'])
-            self.assertEqual(saved['baths'], EXPECTED_VALUES['baths'])
-            self.assertEqual(saved['parking'], EXPECTED_VALUES['parking'])
-
-    def test_parsed_matches_saved(self):
-        """Ensure the parser produces the same values as the saved record."""
-        parsed = parse_snapshot_text(KERRS_ROAD_SNAPSHOT)
-
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM domain_estimates WHERE property_id = '2020510444'
-            ''')
-            row = cursor.fetchone()
-
-            if row is None:
-                self.skipTest("Reference record not found in database")
-
-            saved = dict(row)
-
-            # These should match
-            self.assertEqual(parsed.get('estimate_low'), saved['estimate_low'],
-                           f"estimate_low mismatch: parsed={parsed.get('estimate_low')}, saved={saved['estimate_low']}")
-            self.assertEqual(parsed.get('estimate_mid'), saved['estimate_mid'],
-                           f"estimate_mid mismatch: parsed={parsed.get('estimate_mid')}, saved={saved['estimate_mid']}")
-            self.assertEqual(parsed.get('estimate_high'), saved['estimate_high'],
-                           f"estimate_high mismatch: parsed={parsed.get('estimate_high')}, saved={saved['estimate_high']}")
-            self.assertEqual(parsed.get('beds'), saved['beds'],
-                           f"beds mismatch: parsed={parsed.get('beds')}, saved={saved['beds']}")
-            self.assertEqual(parsed.get('baths'), saved['baths'],
-                           f"baths mismatch: parsed={parsed.get('baths')}, saved={saved['baths']}")
-            self.assertEqual(parsed.get('parking'), saved['parking'],
-                           f"parking mismatch: parsed={parsed.get('parking')}, saved={saved['parking']}")
+    def test_saved_matches_parsed_and_expected(self, saved_record):
+        """Saved record, parser output and expected values all agree."""
+        for field, saved in zip(SAVED_RECORD_FIELDS, saved_record):
+            assert saved == EXPECTED_VALUES[field], \
+                f"{field} mismatch: saved={saved}, expected={EXPECTED_VALUES[field]}"
+            assert _PARSED_KERRS.get(field) == saved, \
+                f"{field} mismatch: parsed={_PARSED_KERRS.get(field)}, saved={saved}"
 
 
 def run_quick_validation():
@@ -249,24 +204,9 @@ def run_quick_validation():
     print(f"\nTest case: 4/52-54 Kerrs Road, Castle Hill")
     print("-" * 60)
 
-    parsed = parse_snapshot_text(KERRS_ROAD_SNAPSHOT)
-
-    checks = [
-        ('beds', 3),
-        ('baths', 2),
-        ('parking', 2),
-        ('land_size', '4277'),
-        ('property_type', 'Townhouse'),
-        ('estimate_low', 1330000),
-        ('estimate_mid', 1540000),
-        ('estimate_high', 1750000),
-        ('estimate_accuracy', 'High'),
-        ('rental_weekly', 860),
-        ('rental_yield', 2.93),
-        ('last_sold_price', 1278800),
-        ('last_sold_days_listed', 8),
-        ('listing_status', 'For Sale - Just Listed'),
-    ]
+    parsed = _PARSED_KERRS
+
+    checks = list(EXPECTED_VALUES.items())
 
     all_passed = True
     for field, expected in checks:
@@ -294,5 +234,5 @@ if __name__ == '__main__':
         success = run_quick_validation()
         sys.exit(0 if success else 1)
     else:
-        # Full test suite
-        unittest.main(verbosity=2)
+        # Full test suite (pytest also collects the unittest classes)
+        sys.exit(pytest.main([__file__, "-v"]))
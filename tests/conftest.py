@@ -4,9 +4,8 @@ Pytest Configuration and Fixtures
 Provides shared fixtures for all tests.
 """
 
-import os
 import sqlite3
-import tempfile
+import uuid
 from pathlib import Path
 from typing import Generator
 
@@ -17,112 +16,131 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
+# Test schema (subset of the production tables)
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS properties (
+    property_id TEXT PRIMARY KEY,
+    address TEXT,
+    suburb TEXT,
+    first_seen TEXT,
+    url TEXT,
+    in_excelsior_catchment INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS listing_history (
+    property_id TEXT,
+    date TEXT,
+    status TEXT,
+    price_display TEXT,
+    price_value INTEGER,
+    beds INTEGER,
+    baths INTEGER,
+    cars INTEGER,
+    land_size TEXT,
+    property_type TEXT,
+    agent TEXT,
+    scraped_at TEXT,
+    sold_date TEXT,
+    sold_date_iso TEXT,
+    price_per_m2 REAL,
+    PRIMARY KEY (property_id, date, status)
+);
+
+CREATE TABLE IF NOT EXISTS daily_summary (
+    date TEXT PRIMARY KEY,
+    new_count INTEGER,
+    sold_count INTEGER,
+    adj_count INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS property_valuations (
+    property_id TEXT PRIMARY KEY,
+    latest_low INTEGER,
+    latest_high INTEGER,
+    propertyvalue_url TEXT,
+    last_updated TEXT
+);
+
+CREATE TABLE IF NOT EXISTS xgboost_predictions (
+    property_id TEXT PRIMARY KEY,
+    predicted_price INTEGER,
+    price_range_low INTEGER,
+    price_range_high INTEGER,
+    predicted_at TEXT,
+    model_version TEXT
+);
+
+CREATE TABLE IF NOT EXISTS domain_estimates (
+    property_id TEXT PRIMARY KEY,
+    address TEXT,
+    suburb TEXT,
+    estimate_low INTEGER,
+    estimate_mid INTEGER,
+    estimate_high INTEGER,
+    estimate_date TEXT,
+    scraped_at TEXT
+);
+"""
+
+
 @pytest.fixture(scope="session")
 def project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).parent.parent
 
 
-@pytest.fixture(scope="function")
-def temp_db() -> Generator[str, None, None]:
-    """Create a temporary test database.
+@pytest.fixture(scope="session")
+def _schema_template() -> Generator[sqlite3.Connection, None, None]:
+    """Build the test schema once in an in-memory database.
 
     Yields:
-        Path to temporary database file.
+        Connection to the empty template database.
     """
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-
-    # Initialize database schema
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Create tables
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS properties (
-            property_id TEXT PRIMARY KEY,
-            address TEXT,
-            suburb TEXT,
-            first_seen TEXT,
-            url TEXT,
-            in_excelsior_catchment INTEGER DEFAULT 0
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS listing_history (
-            property_id TEXT,
-            date TEXT,
-            status TEXT,
-            price_display TEXT,
-            price_value INTEGER,
-            beds INTEGER,
-            baths INTEGER,
-            cars INTEGER,
-            land_size TEXT,
-            property_type TEXT,
-            agent TEXT,
-            scraped_at TEXT,
-            sold_date TEXT,
-            sold_date_iso TEXT,
-            price_per_m2 REAL,
-            PRIMARY KEY (property_id, date, status)
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS daily_summary (
-            date TEXT PRIMARY KEY,
-            new_count INTEGER,
-            sold_count INTEGER,
-            adj_count INTEGER
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS property_valuations (
-            property_id TEXT PRIMARY KEY,
-            latest_low INTEGER,
-            latest_high INTEGER,
-            propertyvalue_url TEXT,
-            last_updated TEXT
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS xgboost_predictions (
-            property_id TEXT PRIMARY KEY,
-            predicted_price INTEGER,
-            price_range_low INTEGER,
-            price_range_high INTEGER,
-            predicted_at TEXT,
-            model_version TEXT
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS domain_estimates (
-            property_id TEXT PRIMARY KEY,
-            address TEXT,
-            suburb TEXT,
-            estimate_low INTEGER,
-            estimate_mid INTEGER,
-            estimate_high INTEGER,
-            estimate_date TEXT,
-            scraped_at TEXT
-        )
-    """)
-
-    conn.commit()
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(_SCHEMA_SQL)
+
+    yield conn
+
     conn.close()
 
-    yield db_path
 
-    # Cleanup
-    try:
-        os.unlink(db_path)
-    except (OSError, PermissionError):
-        pass
+@pytest.fixture(scope="function")
+def temp_db(_schema_template: sqlite3.Connection) -> Generator[str, None, None]:
+    """Create a temporary in-memory test database.
+
+    The database is a shared-cache in-memory SQLite URI, so every
+    connection opened on it within the test sees the same data and nothing
+    touches the filesystem. The schema is copied from the session template
+    with the SQLite backup API.
+
+    Yields:
+        SQLite "file:" URI of the temporary database.
+    """
+    db_uri = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+    # An in-memory database lives as long as its last connection
+    keeper = sqlite3.connect(db_uri, uri=True)
+    _schema_template.backup(keeper)
+
+    yield db_uri
+
+    keeper.close()
+
+
+@pytest.fixture(scope="function")
+def db_conn(temp_db: str) -> Generator[sqlite3.Connection, None, None]:
+    """Open connection (dict rows) to the temporary test database.
+
+    Args:
+        temp_db: URI of temporary database.
+
+    Yields:
+        Connection from get_connection().
+    """
+    from baulkandcastle.core.database import get_connection
+
+    with get_connection(temp_db) as conn:
+        yield conn
 
 
 @pytest.fixture(scope="function")
@@ -130,7 +148,7 @@ def test_config(temp_db: str, monkeypatch):
     """Create test configuration with temp database.
 
     Args:
-        temp_db: Path to temporary database.
+        temp_db: URI of temporary database.
         monkeypatch: pytest monkeypatch fixture.
 
     Yields:
@@ -215,75 +233,60 @@ def populated_db(temp_db: str, sample_property_data: dict, sample_sold_property:
     """Create a database with sample data.
 
     Returns:
-        Path to populated database.
+        URI of populated database.
     """
-    conn = sqlite3.connect(temp_db)
-    cursor = conn.cursor()
-
-    # Insert for-sale property
-    cursor.execute("""
-        INSERT INTO properties (property_id, address, suburb, first_seen, url)
-        VALUES (?, ?, ?, ?, ?)
-    """, (
-        sample_property_data["id"],
-        sample_property_data["address"],
-        sample_property_data["suburb"],
-        "2024-01-01",
-        sample_property_data["url"],
-    ))
-
-    cursor.execute("""
-        INSERT INTO listing_history (
-            property_id, date, status, price_display, price_value,
-            beds, baths, cars, land_size, property_type
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        sample_property_data["id"],
-        "2024-01-01",
-        "sale",
-        sample_property_data["price_display"],
-        sample_property_data["price_value"],
-        sample_property_data["bedrooms"],
-        sample_property_data["bathrooms"],
-        sample_property_data["parking"],
-        sample_property_data["land_size"],
-        sample_property_data["property_type"],
-    ))
-
-    # Insert sold property
-    cursor.execute("""
-        INSERT INTO properties (property_id, address, suburb, first_seen, url)
-        VALUES (?, ?, ?, ?, ?)
-    """, (
-        sample_sold_property["id"],
-        sample_sold_property["address"],
-        sample_sold_property["suburb"],
-        "2023-12-01",
-        sample_sold_property["url"],
-    ))
-
-    cursor.execute("""
-        INSERT INTO listing_history (
-            property_id, date, status, price_display, price_value,
-            beds, baths, cars, land_size, property_type,
-            sold_date, sold_date_iso
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        sample_sold_property["id"],
-        "2024-01-15",
-        "sold",
-        sample_sold_property["price_display"],
-        sample_sold_property["price_value"],
-        sample_sold_property["bedrooms"],
-        sample_sold_property["bathrooms"],
-        sample_sold_property["parking"],
-        sample_sold_property["land_size"],
-        sample_sold_property["property_type"],
-        sample_sold_property["sold_date"],
-        sample_sold_property["sold_date_iso"],
-    ))
-
-    conn.commit()
+    sale, sold = sample_property_data, sample_sold_property
+
+    conn = sqlite3.connect(temp_db, uri=True)
+
+    with conn:
+        conn.executemany("""
+            INSERT INTO properties (property_id, address, suburb, first_seen, url)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (sale["id"], sale["address"], sale["suburb"], "2024-01-01", sale["url"]),
+            (sold["id"], sold["address"], sold["suburb"], "2023-12-01", sold["url"]),
+        ])
+
+        conn.executemany("""
+            INSERT INTO listing_history (
+                property_id, date, status, price_display, price_value,
+                beds, baths, cars, land_size, property_type,
+                sold_date, sold_date_iso
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                sale["id"], "2024-01-01", "sale",
+                sale["price_display"], sale["price_value"],
+                sale["bedrooms"], sale["bathrooms"], sale["parking"],
+                sale["land_size"], sale["property_type"],
+                None, None,
+            ),
+            (
+                sold["id"], "2024-01-15", "sold",
+                sold["price_display"], sold["price_value"],
+                sold["bedrooms"], sold["bathrooms"], sold["parking"],
+                sold["land_size"], sold["property_type"],
+                sold["sold_date"], sold["sold_date_iso"],
+            ),
+        ])
+
     conn.close()
 
     return temp_db
+
+
+@pytest.fixture(scope="function")
+def populated_conn(populated_db: str) -> Generator[sqlite3.Connection, None, None]:
+    """Open connection (dict rows) to the populated test database.
+
+    Args:
+        populated_db: URI of populated database.
+
+    Yields:
+        Connection from get_connection().
+    """
+    from baulkandcastle.core.database import get_connection
+
+    with get_connection(populated_db) as conn:
+        yield conn
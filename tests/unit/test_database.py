@@ -41,99 +41,89 @@ class TestGetConnection:
 class TestFetchAll:
     """Tests for fetch_all function."""
 
-    def test_fetch_all_returns_list(self, temp_db):
-        with get_connection(temp_db) as conn:
-            results = fetch_all(conn, "SELECT * FROM properties")
-            assert isinstance(results, list)
+    def test_fetch_all_returns_list(self, db_conn):
+        results = fetch_all(db_conn, "SELECT * FROM properties")
+        assert isinstance(results, list)
 
-    def test_fetch_all_with_params(self, populated_db):
-        with get_connection(populated_db) as conn:
-            results = fetch_all(
-                conn,
-                "SELECT * FROM properties WHERE suburb = ?",
-                ("CASTLE HILL",)
-            )
-            assert len(results) == 1
-            assert results[0]["suburb"] == "CASTLE HILL"
+    def test_fetch_all_with_params(self, populated_conn):
+        results = fetch_all(
+            populated_conn,
+            "SELECT * FROM properties WHERE suburb = ?",
+            ("CASTLE HILL",)
+        )
+        assert len(results) == 1
+        assert results[0]["suburb"] == "CASTLE HILL"
 
 
 class TestFetchOne:
     """Tests for fetch_one function."""
 
-    def test_fetch_one_returns_dict(self, populated_db):
-        with get_connection(populated_db) as conn:
-            result = fetch_one(
-                conn,
-                "SELECT * FROM properties WHERE suburb = ?",
-                ("CASTLE HILL",)
-            )
-            assert isinstance(result, dict)
-            assert result["suburb"] == "CASTLE HILL"
-
-    def test_fetch_one_returns_none_when_empty(self, temp_db):
-        with get_connection(temp_db) as conn:
-            result = fetch_one(
-                conn,
-                "SELECT * FROM properties WHERE property_id = ?",
-                ("nonexistent",)
-            )
-            assert result is None
+    def test_fetch_one_returns_dict(self, populated_conn):
+        result = fetch_one(
+            populated_conn,
+            "SELECT * FROM properties WHERE suburb = ?",
+            ("CASTLE HILL",)
+        )
+        assert isinstance(result, dict)
+        assert result["suburb"] == "CASTLE HILL"
+
+    def test_fetch_one_returns_none_when_empty(self, db_conn):
+        result = fetch_one(
+            db_conn,
+            "SELECT * FROM properties WHERE property_id = ?",
+            ("nonexistent",)
+        )
+        assert result is None
 
 
 class TestExecute:
     """Tests for execute function."""
 
-    def test_execute_insert(self, temp_db):
-        with get_connection(temp_db) as conn:
-            rowcount = execute(
-                conn,
-                "INSERT INTO properties (property_id, address, suburb) VALUES (?, ?, ?)",
-                ("test-1", "123 Test St", "CASTLE HILL")
-            )
-            assert rowcount == 1
-
-    def test_execute_update(self, populated_db):
-        with get_connection(populated_db) as conn:
-            rowcount = execute(
-                conn,
-                "UPDATE properties SET address = ? WHERE suburb = ?",
-                ("Updated Address", "CASTLE HILL")
-            )
-            assert rowcount >= 1
+    def test_execute_insert(self, db_conn):
+        rowcount = execute(
+            db_conn,
+            "INSERT INTO properties (property_id, address, suburb) VALUES (?, ?, ?)",
+            ("test-1", "123 Test St", "CASTLE HILL")
+        )
+        assert rowcount == 1
+
+    def test_execute_update(self, populated_conn):
+        rowcount = execute(
+            populated_conn,
+            "UPDATE properties SET address = ? WHERE suburb = ?",
+            ("Updated Address", "CASTLE HILL")
+        )
+        assert rowcount >= 1
 
 
 class TestTableExists:
     """Tests for table_exists function."""
 
-    def test_existing_table(self, temp_db):
-        with get_connection(temp_db) as conn:
-            assert table_exists(conn, "properties") is True
-            assert table_exists(conn, "listing_history") is True
+    def test_existing_table(self, db_conn):
+        assert table_exists(db_conn, "properties") is True
+        assert table_exists(db_conn, "listing_history") is True
 
-    def test_nonexistent_table(self, temp_db):
-        with get_connection(temp_db) as conn:
-            assert table_exists(conn, "nonexistent_table") is False
+    def test_nonexistent_table(self, db_conn):
+        assert table_exists(db_conn, "nonexistent_table") is False
 
 
 class TestAddColumnIfNotExists:
     """Tests for add_column_if_not_exists function."""
 
-    def test_add_new_column(self, temp_db):
-        with get_connection(temp_db) as conn:
-            result = add_column_if_not_exists(
-                conn, "properties", "new_column", "TEXT"
-            )
-            assert result is True
-
-            # Verify column exists
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(properties)")
-            columns = [row["name"] for row in cursor.fetchall()]
-            assert "new_column" in columns
-
-    def test_existing_column_returns_false(self, temp_db):
-        with get_connection(temp_db) as conn:
-            result = add_column_if_not_exists(
-                conn, "properties", "address", "TEXT"
-            )
-            assert result is False
+    def test_add_new_column(self, db_conn):
+        result = add_column_if_not_exists(
+            db_conn, "properties", "new_column", "TEXT"
+        )
+        assert result is True
+
+        # Verify column exists
+        cursor = db_conn.cursor()
+        cursor.execute("PRAGMA table_info(properties)")
+        columns = [row["name"] for row in cursor.fetchall()]
+        assert "new_column" in columns
+
+    def test_existing_column_returns_false(self, db_conn):
+        result = add_column_if_not_exists(
+            db_conn, "properties", "address", "TEXT"
+        )
+        assert result is False
@@ -4,14 +4,17 @@ Unit tests for date_parser module.
 
 from datetime import datetime
 
+import pandas as pd
 import pytest
 
 from baulkandcastle.utils.date_parser import (
     parse_date,
+    parse_date_series,
     parse_to_iso,
     parse_snapshot_date,
     format_date,
     days_between,
+    days_between_dt,
     get_season,
     years_since,
 )
@@ -40,11 +43,23 @@ class TestParseDate:
         result = parse_date("15 January 2024")
         assert result == datetime(2024, 1, 15)
 
+    def test_upper_case_month_containing_t(self):
+        assert parse_date("15 OCT 2024") == datetime(2024, 10, 15)
+
+    def test_invalid_day_returns_none(self):
+        assert parse_date("2024-02-30") is None
+
     def test_month_year(self):
         result = parse_date("Jan 2024")
         assert result.year == 2024
         assert result.month == 1
 
+    def test_dashed_australian_format(self):
+        assert parse_date("15-01-2024") == datetime(2024, 1, 15)
+
+    def test_unpadded_australian_format(self):
+        assert parse_date("5/1/2024") == datetime(2024, 1, 5)
+
     def test_empty_string(self):
         assert parse_date("") is None
 
@@ -54,6 +69,29 @@ class TestParseDate:
     def test_invalid_format(self):
         assert parse_date("not a date") is None
 
+    def test_repeated_input_reuses_cached_result(self):
+        assert parse_date(" 15 Jan 2024 ") is parse_date("15 Jan 2024")
+
+
+class TestParseDateSeries:
+    """Tests for parse_date_series function."""
+
+    def test_matches_parse_date(self):
+        values = [
+            "2024-01-15", "2024-01-15T10:30:00", "15/01/2024", "15 Jan 2024",
+            "15 January 2024", "Jan 2024", "15Jan2024", "15-01-2024", "15 OCT 2024",
+        ]
+        result = parse_date_series(pd.Series(values))
+        assert list(result) == [pd.Timestamp(parse_date(v)) for v in values]
+
+    def test_unparseable_values_are_nat(self):
+        result = parse_date_series(pd.Series([None, "", "not a date", "2024-02-30"]))
+        assert result.isna().all()
+
+    def test_preserves_index(self):
+        series = pd.Series(["2024-01-15", None], index=[10, 20])
+        assert list(parse_date_series(series).index) == [10, 20]
+
 
 class TestParseToIso:
     """Tests for parse_to_iso function."""
@@ -67,6 +105,12 @@ class TestParseToIso:
     def test_already_iso(self):
         assert parse_to_iso("2024-01-15") == "2024-01-15"
 
+    def test_iso_with_time_to_iso(self):
+        assert parse_to_iso("2024-01-15T10:30:00") == "2024-01-15"
+
+    def test_invalid_iso_date_returns_none(self):
+        assert parse_to_iso("2024-02-30") is None
+
     def test_none_returns_none(self):
         assert parse_to_iso(None) is None
 
@@ -83,6 +127,9 @@ class TestParseSnapshotDate:
         result = parse_snapshot_date("As at 15 Jan 2024")
         assert result == "2024-01-15"
 
+    def test_last_updated_prefix(self):
+        assert parse_snapshot_date("Last updated 15 Jan 2024") == "2024-01-15"
+
     def test_empty_string(self):
         assert parse_snapshot_date("") is None
 
@@ -123,6 +170,18 @@ class TestDaysBetween:
         assert days_between("invalid", "2024-01-01") is None
 
 
+class TestDaysBetweenDt:
+    """Tests for days_between_dt function."""
+
+    def test_whole_days(self):
+        assert days_between_dt(datetime(2024, 1, 1), datetime(2024, 1, 11)) == 10
+
+    def test_order_independent_with_time_of_day(self):
+        d1 = datetime(2024, 1, 2, 0, 0)
+        d2 = datetime(2024, 1, 1, 12, 0)
+        assert days_between_dt(d1, d2) == days_between_dt(d2, d1) == 0
+
+
 class TestGetSeason:
     """Tests for get_season function."""
 
@@ -0,0 +1,60 @@
+"""
+Unit tests for feature_engineering module.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from baulkandcastle.ml.feature_engineering import (
+    compute_rolling_avg_price_per_m2,
+    compute_rolling_avg_price_per_m2_batch,
+)
+
+
+@pytest.fixture
+def sales_df() -> pd.DataFrame:
+    """Synthetic sold listings across two suburbs."""
+    rng = np.random.default_rng(0)
+    n = 60
+    dates = pd.to_datetime("2023-01-01") + pd.to_timedelta(rng.integers(0, 400, n), unit="D")
+    df = pd.DataFrame({
+        "suburb": rng.choice(["CASTLE HILL", "Baulkham Hills"], n),
+        "price_per_m2": rng.uniform(2000, 9000, n),
+        "sold_date_parsed": dates,
+    })
+    df.loc[::7, "price_per_m2"] = np.nan
+    df.loc[5, "sold_date_parsed"] = pd.NaT
+    return df
+
+
+class TestRollingAvgBatch:
+    """Tests for compute_rolling_avg_price_per_m2_batch function."""
+
+    def test_matches_per_row_computation(self, sales_df):
+        result = compute_rolling_avg_price_per_m2_batch(sales_df)
+        for i, row in sales_df.iterrows():
+            if pd.isna(row["sold_date_parsed"]):
+                assert np.isnan(result[i])
+                continue
+            expected = compute_rolling_avg_price_per_m2(
+                sales_df, row["sold_date_parsed"], row["suburb"]
+            )
+            assert result[i] == pytest.approx(expected)
+
+    def test_presorted_frame_gives_same_result(self, sales_df):
+        sorted_df = sales_df.sort_values(["suburb", "sold_date_parsed"], kind="mergesort")
+        expected = pd.Series(compute_rolling_avg_price_per_m2_batch(sales_df), index=sales_df.index)
+        result = compute_rolling_avg_price_per_m2_batch(sorted_df)
+        np.testing.assert_allclose(result, expected.loc[sorted_df.index].to_numpy())
+
+    def test_sparse_data_uses_default(self):
+        df = pd.DataFrame({
+            "suburb": ["CASTLE HILL"] * 3,
+            "price_per_m2": [5000.0, 6000.0, 7000.0],
+            "sold_date_parsed": [datetime(2024, 1, d) for d in (1, 2, 3)],
+        })
+        result = compute_rolling_avg_price_per_m2_batch(df, default=1234.0)
+        assert list(result) == [1234.0, 1234.0, 1234.0]
@@ -0,0 +1,73 @@
+"""
+Unit tests for parse_cache module.
+"""
+
+import shelve
+
+import pytest
+
+from baulkandcastle.utils.date_parser import _ISO_PARSE_VERSION, parse_to_iso
+from baulkandcastle.utils.parse_cache import _clear_memoized, persistent_parse_cache
+from baulkandcastle.utils.price_parser import _PRICE_PARSE_VERSION, extract_price_value
+
+ISO_PREFIX = f"iso:v{_ISO_PARSE_VERSION}\x00"
+PRICE_PREFIX = f"price:v{_PRICE_PARSE_VERSION}\x00"
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_memos():
+    """Keep memoized parse results from leaking between tests."""
+    _clear_memoized()
+    yield
+    _clear_memoized()
+
+
+class TestPersistentParseCache:
+    """Tests for persistent_parse_cache context manager."""
+
+    def test_results_are_written_to_store(self, tmp_path):
+        path = tmp_path / "cache" / "parse"
+        with persistent_parse_cache(path):
+            assert parse_to_iso("7 Mar 2031") == "2031-03-07"
+            assert extract_price_value("$3,456,789") == 3456789
+
+        with shelve.open(str(path)) as store:
+            assert store[ISO_PREFIX + "7 Mar 2031"] == "2031-03-07"
+            assert store[PRICE_PREFIX + "$3,456,789"] == 3456789
+
+    def test_results_memoized_before_the_block_are_written(self, tmp_path):
+        path = tmp_path / "parse"
+        assert parse_to_iso("9 Mar 2031") == "2031-03-09"
+        with persistent_parse_cache(path):
+            assert parse_to_iso("9 Mar 2031") == "2031-03-09"
+
+        with shelve.open(str(path)) as store:
+            assert store[ISO_PREFIX + "9 Mar 2031"] == "2031-03-09"
+
+    def test_stored_results_are_reused(self, tmp_path):
+        path = tmp_path / "parse"
+        with shelve.open(str(path)) as store:
+            store[ISO_PREFIX + "seeded snapshot text"] = "1999-12-31"
+
+        with persistent_parse_cache(path):
+            assert parse_to_iso("seeded snapshot text") == "1999-12-31"
+
+        # Stored values do not outlive the block
+        assert parse_to_iso("seeded snapshot text") is None
+
+    def test_results_from_other_versions_are_ignored(self, tmp_path):
+        path = tmp_path / "parse"
+        with shelve.open(str(path)) as store:
+            store[f"price:v{_PRICE_PARSE_VERSION - 1}\x00$2.01M"] = 2009999
+
+        with persistent_parse_cache(path):
+            assert extract_price_value("$2.01M") == 2_010_000
+
+    def test_nested_use_shares_store(self, tmp_path):
+        path = tmp_path / "parse"
+        with persistent_parse_cache(path):
+            with persistent_parse_cache(tmp_path / "other"):
+                assert parse_to_iso("8 Mar 2031") == "2031-03-08"
+
+        with shelve.open(str(path)) as store:
+            assert ISO_PREFIX + "8 Mar 2031" in store
@@ -2,53 +2,87 @@
 Unit tests for price_parser module.
 """
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from baulkandcastle.utils.price_parser import (
     extract_price_value,
+    extract_price_series,
     parse_price,
     format_price,
     format_price_range,
     calculate_price_per_sqm,
+    calculate_price_per_sqm_batch,
 )
 
 
 class TestExtractPriceValue:
     """Tests for extract_price_value function."""
 
-    def test_standard_format(self):
-        assert extract_price_value("$1,500,000") == 1500000
-
-    def test_millions_shorthand(self):
-        assert extract_price_value("$1.5M") == 1500000
-        assert extract_price_value("$1.5m") == 1500000
-        assert extract_price_value("$2M") == 2000000
-
-    def test_thousands_shorthand(self):
-        assert extract_price_value("$500K") == 500000
-        assert extract_price_value("$500k") == 500000
-
-    def test_no_dollar_sign(self):
-        assert extract_price_value("1500000") == 1500000
-
-    def test_price_range_returns_lower(self):
-        assert extract_price_value("$1,500,000 - $1,700,000") == 1500000
-
-    def test_auction_returns_none(self):
-        assert extract_price_value("Auction") is None
-
-    def test_contact_agent_returns_none(self):
-        assert extract_price_value("Contact Agent") is None
-
-    def test_empty_string(self):
-        assert extract_price_value("") is None
-
-    def test_none(self):
-        assert extract_price_value(None) is None
-
-    def test_small_number_ignored(self):
+    @pytest.mark.parametrize("text,expected", [
+        # Standard format
+        ("$1,500,000", 1500000),
+        ("1500000", 1500000),
+        # Millions / thousands shorthand, scaled exactly
+        ("$1.5M", 1500000),
+        ("$1.5m", 1500000),
+        ("$2M", 2000000),
+        ("$500K", 500000),
+        ("$500k", 500000),
+        ("$2.01M", 2_010_000),
+        ("Guide $2.01m", 2_010_000),
+        # Ranges return the lower bound, sharing the upper multiplier
+        ("$1,500,000 - $1,700,000", 1500000),
+        ("$950K - $1.1M", 950_000),
+        ("1.5-1.7M", 1_500_000),
+        # Non-prices
+        ("Auction", None),
+        ("Contact Agent", None),
+        ("", None),
+        (None, None),
         # Numbers under 10000 should be ignored as they're not prices
-        assert extract_price_value("$100") is None
+        ("$100", None),
+    ])
+    def test_extracts(self, text, expected):
+        assert extract_price_value(text) == expected
+
+
+class TestExtractPriceSeries:
+    """Tests for extract_price_series function."""
+
+    @pytest.mark.parametrize("values", [
+        [
+            "$1,500,000", "$1.5M", "$500K", "$1,500,000 - $1,700,000",
+            "Price Guide $1,500,000", "Auction", "Contact Agent", "$9,000", None, "",
+        ],
+        # No k/m suffix anywhere in the batch
+        ["$1,500,000"],
+        ["$1,500,000", "$900,000 - $950,000"],
+        # No price token in any row
+        ["Auction", "Contact agent"],
+        [None],
+        [],
+        # Non-ASCII digits, which the scalar parser reads
+        ["$\uff11,\uff15\uff10\uff10,\uff10\uff10\uff10", "$1.5M", None],
+    ])
+    def test_matches_extract_price_value(self, values):
+        result = extract_price_series(pd.Series(values, dtype=object))
+        expected = [extract_price_value(v) for v in values]
+        assert str(result.dtype) == "Int64"
+        assert [None if pd.isna(v) else int(v) for v in result] == expected
+
+    def test_keeps_input_index(self):
+        prices = pd.Series(["Auction", "$1,500,000"], index=[7, 3])
+        result = extract_price_series(prices)
+        assert list(result.index) == [7, 3]
+        assert result[3] == 1_500_000
+
+    def test_returns_nullable_integers(self):
+        result = extract_price_series(pd.Series(["$1.25M", None]))
+        assert str(result.dtype) == "Int64"
+        assert result[0] == 1_250_000
+        assert pd.isna(result[1])
 
 
 class TestParsePrice:
@@ -69,6 +103,9 @@ class TestParsePrice:
         assert low == 1500000
         assert high == 1700000
 
+    def test_range_scaling_is_exact(self):
+        assert parse_price("$2.01M - $2.03M") == (2_010_000, 2_030_000)
+
     def test_empty_returns_none(self):
         low, high = parse_price("")
         assert low is None
@@ -78,19 +115,16 @@ class TestParsePrice:
 class TestFormatPrice:
     """Tests for format_price function."""
 
-    def test_standard_format(self):
-        assert format_price(1500000) == "$1,500,000"
-
-    def test_compact_millions(self):
-        assert format_price(1500000, compact=True) == "$1.5M"
-        assert format_price(2000000, compact=True) == "$2M"
-
-    def test_compact_thousands(self):
-        assert format_price(500000, compact=True) == "$500K"
-        assert format_price(750000, compact=True) == "$750K"
-
-    def test_none_returns_dash(self):
-        assert format_price(None) == "-"
+    @pytest.mark.parametrize("price,compact,expected", [
+        (1500000, False, "$1,500,000"),
+        (1500000, True, "$1.5M"),
+        (2000000, True, "$2M"),
+        (500000, True, "$500K"),
+        (750000, True, "$750K"),
+        (None, False, "-"),
+    ])
+    def test_formats(self, price, compact, expected):
+        assert format_price(price, compact=compact) == expected
 
 
 class TestFormatPriceRange:
@@ -132,3 +166,24 @@ class TestCalculatePricePerSqm:
 
     def test_none_land_size(self):
         assert calculate_price_per_sqm(1000000, None) is None
+
+
+class TestCalculatePricePerSqmBatch:
+    """Tests for calculate_price_per_sqm_batch function."""
+
+    def test_matches_scalar(self):
+        prices = [1000000, 1000000, None, 0, 1200000, 900000]
+        land_sizes = ["500m²", 400.0, "500m²", 500, "na", None]
+        result = calculate_price_per_sqm_batch(prices, land_sizes)
+        for price, land_size, value in zip(prices, land_sizes, result):
+            expected = calculate_price_per_sqm(price, land_size)
+            if expected is None:
+                assert np.isnan(value)
+            else:
+                assert value == expected
+
+    def test_numeric_arrays(self):
+        result = calculate_price_per_sqm_batch(np.array([1e6, 2e6]), np.array([500.0, 0.0]))
+        assert result[0] == 2000.0
+        assert np.isnan(result[1])
+
@@ -10,102 +10,94 @@ from baulkandcastle.utils.property_types import (
     is_house_type,
     is_townhouse_type,
     get_default_land_size,
+    extract_property_type_from_url,
     PROPERTY_TYPE_MAP,
+    HOUSE_TYPES,
+    TOWNHOUSE_TYPES,
+    UNIT_TYPES,
 )
 
 
 class TestConsolidatePropertyType:
     """Tests for consolidate_property_type function."""
 
-    def test_house_types(self):
-        assert consolidate_property_type("house") == "house"
-        assert consolidate_property_type("free-standing") == "house"
-        assert consolidate_property_type("duplex") == "house"
-        assert consolidate_property_type("semi-detached") == "house"
-        assert consolidate_property_type("terrace") == "house"
-        assert consolidate_property_type("villa") == "house"
-
-    def test_unit_types(self):
-        assert consolidate_property_type("unit") == "unit"
-        assert consolidate_property_type("apartment") == "unit"
-        assert consolidate_property_type("apartment-unit-flat") == "unit"
-        assert consolidate_property_type("studio") == "unit"
-        assert consolidate_property_type("pent-house") == "unit"
-        assert consolidate_property_type("flat") == "unit"
-
-    def test_townhouse_types(self):
-        assert consolidate_property_type("townhouse") == "townhouse"
-        assert consolidate_property_type("town-house") == "townhouse"
-
-    def test_other_types(self):
-        assert consolidate_property_type("vacant-land") == "other"
-        assert consolidate_property_type("land") == "other"
-        assert consolidate_property_type("development-site") == "other"
-
-    def test_case_insensitive(self):
-        assert consolidate_property_type("HOUSE") == "house"
-        assert consolidate_property_type("House") == "house"
-        assert consolidate_property_type("APARTMENT") == "unit"
-
-    def test_none_returns_other(self):
-        assert consolidate_property_type(None) == "other"
-
-    def test_empty_returns_other(self):
-        assert consolidate_property_type("") == "other"
-
-    def test_unknown_returns_other(self):
-        assert consolidate_property_type("unknown-type") == "other"
+    @pytest.mark.parametrize("prop_type,expected", [
+        # House types
+        ("house", "house"),
+        ("free-standing", "house"),
+        ("duplex", "house"),
+        ("semi-detached", "house"),
+        ("terrace", "house"),
+        ("villa", "house"),
+        # Unit types
+        ("unit", "unit"),
+        ("apartment", "unit"),
+        ("apartment-unit-flat", "unit"),
+        ("studio", "unit"),
+        ("pent-house", "unit"),
+        ("flat", "unit"),
+        # Townhouse types
+        ("townhouse", "townhouse"),
+        ("town-house", "townhouse"),
+        # Other types
+        ("vacant-land", "other"),
+        ("land", "other"),
+        ("development-site", "other"),
+        # Case insensitive
+        ("HOUSE", "house"),
+        ("House", "house"),
+        ("APARTMENT", "unit"),
+        # Missing or unknown
+        (None, "other"),
+        ("", "other"),
+        ("unknown-type", "other"),
+    ])
+    def test_consolidates(self, prop_type, expected):
+        assert consolidate_property_type(prop_type) == expected
 
 
 class TestIsUnitType:
     """Tests for is_unit_type function."""
 
-    def test_unit_types_return_true(self):
-        assert is_unit_type("unit") is True
-        assert is_unit_type("apartment") is True
-        assert is_unit_type("apartment-unit-flat") is True
-        assert is_unit_type("studio") is True
-
-    def test_house_returns_false(self):
-        assert is_unit_type("house") is False
-
-    def test_townhouse_returns_false(self):
-        assert is_unit_type("townhouse") is False
-
-    def test_none_returns_false(self):
-        assert is_unit_type(None) is False
+    @pytest.mark.parametrize("prop_type,expected", [
+        ("unit", True),
+        ("apartment", True),
+        ("apartment-unit-flat", True),
+        ("studio", True),
+        ("house", False),
+        ("townhouse", False),
+        (None, False),
+    ])
+    def test_is_unit_type(self, prop_type, expected):
+        assert is_unit_type(prop_type) is expected
 
 
 class TestIsHouseType:
     """Tests for is_house_type function."""
 
-    def test_house_types_return_true(self):
-        assert is_house_type("house") is True
-        assert is_house_type("free-standing") is True
-        assert is_house_type("duplex") is True
-
-    def test_unit_returns_false(self):
-        assert is_house_type("apartment") is False
-
-    def test_townhouse_returns_false(self):
-        assert is_house_type("townhouse") is False
-
-    def test_none_returns_false(self):
-        assert is_house_type(None) is False
+    @pytest.mark.parametrize("prop_type,expected", [
+        ("house", True),
+        ("free-standing", True),
+        ("duplex", True),
+        ("apartment", False),
+        ("townhouse", False),
+        (None, False),
+    ])
+    def test_is_house_type(self, prop_type, expected):
+        assert is_house_type(prop_type) is expected
 
 
 class TestIsTownhouseType:
     """Tests for is_townhouse_type function."""
 
-    def test_townhouse_returns_true(self):
-        assert is_townhouse_type("townhouse") is True
-        assert is_townhouse_type("town-house") is True
-
-    def test_house_returns_false(self):
-        assert is_townhouse_type("house") is False
-
-    def test_unit_returns_false(self):
-        assert is_townhouse_type("apartment") is False
+    @pytest.mark.parametrize("prop_type,expected", [
+        ("townhouse", True),
+        ("town-house", True),
+        ("house", False),
+        ("apartment", False),
+    ])
+    def test_is_townhouse_type(self, prop_type, expected):
+        assert is_townhouse_type(prop_type) is expected
 
 
 class TestGetDefaultLandSize:
@@ -124,3 +116,38 @@ class TestGetDefaultLandSize:
     def test_other_default(self):
         assert get_default_land_size("other") == 400.0
         assert get_default_land_size(None) == 400.0
+
+
+class TestExtractPropertyTypeFromUrl:
+    """Tests for extract_property_type_from_url function."""
+
+    def test_type_token_in_url(self):
+        url = "https://www.domain.com.au/123-smith-st-house-castle-hill-2154"
+        assert extract_property_type_from_url(url) == "house"
+
+    def test_type_token_at_end(self):
+        assert extract_property_type_from_url("listing-Townhouse") == "townhouse"
+
+    def test_longest_alias_wins(self):
+        assert extract_property_type_from_url("x-apartment-unit-flat-2154") == "apartment-unit-flat"
+
+    def test_no_type_returns_none(self):
+        assert extract_property_type_from_url("https://www.domain.com.au/123-smith-st") is None
+        assert extract_property_type_from_url("") is None
+
+
+class TestPropertyTypeMap:
+    """Tests for the PROPERTY_TYPE_MAP constant."""
+
+    def test_is_read_only(self):
+        with pytest.raises(TypeError):
+            PROPERTY_TYPE_MAP["bungalow"] = "house"
+
+    def test_type_sets_are_covered_by_map(self):
+        for types, category in [
+            (HOUSE_TYPES, "house"),
+            (UNIT_TYPES, "unit"),
+            (TOWNHOUSE_TYPES, "townhouse"),
+        ]:
+            for prop_type in types:
+                assert PROPERTY_TYPE_MAP[prop_type] == category
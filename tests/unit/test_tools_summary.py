@@ -1,18 +1,34 @@
 """Unit tests for tool summary extraction functions."""
 
 import json
-import pytest
-
-# Import the functions we're testing
-import sys
+import os
+import subprocess
 from pathlib import Path
 
-# Add the src directory to path so we can import baulkandcastle
-src_path = Path(__file__).parent.parent.parent / "src"
-sys.path.insert(0, str(src_path))
+import pytest
 
 from baulkandcastle.api.tools import _extract_summary, _extract_json_summary
 
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_VENV_PY = _PROJECT_ROOT / ".venv" / "Scripts" / "python.exe"
+_HAS_VENV = _VENV_PY.exists()
+
+# Child environment forcing unbuffered UTF-8 output, built once per module
+_UTF8_ENV = {**os.environ, "PYTHONUNBUFFERED": "1", "PYTHONIOENCODING": "utf-8"}
+
+
+def _run_utf8(argv, cwd=None, timeout=10):
+    """Run argv, capturing stdout/stderr decoded as UTF-8 with replacement."""
+    return subprocess.run(
+        argv,
+        capture_output=True,
+        encoding="utf-8",
+        errors="replace",
+        env=_UTF8_ENV,
+        cwd=cwd,
+        timeout=timeout,
+    )
+
 
 class TestExtractJsonSummary:
     """Tests for _extract_json_summary function."""
@@ -149,26 +165,26 @@ class TestExtractSummary:
         summary, json_str = _extract_summary(stdout, "", "unknown-tool")
         assert len(summary) <= 200
 
+    def test_truncates_long_keyword_match(self):
+        """Should truncate tool-specific keyword matches to 200 chars."""
+        stdout = "Scraped " + "x" * 300 + "\nDone"
+        summary, json_str = _extract_summary(stdout, "", "scraper")
+        assert summary == ("Scraped " + "x" * 300)[:200]
+
+    def test_long_output_keeps_last_line_whole(self):
+        """Should return the start of the last line even when it exceeds the scanned tail."""
+        stdout = "header\n" * 1000 + "Finished " + "y" * 10000
+        summary, json_str = _extract_summary(stdout, "", "unknown-tool")
+        assert summary == ("Finished " + "y" * 10000)[:200]
+
 
 class TestSubprocessEncoding:
     """Tests for subprocess output capture with encoding handling."""
 
     def test_utf8_encoding_captures_unicode(self):
         """Should capture output with Unicode characters using UTF-8 encoding."""
-        import subprocess
-        import os
-
         # Create a subprocess that outputs Unicode characters
-        process = subprocess.Popen(
-            ["python", "-c", "print('Hello 世界 🌍 émojis')"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            env={**os.environ, "PYTHONUNBUFFERED": "1", "PYTHONIOENCODING": "utf-8"},
-        )
-        stdout, stderr = process.communicate(timeout=10)
+        stdout = _run_utf8(["python", "-c", "print('Hello 世界 🌍 émojis')"]).stdout
 
         assert stdout is not None
         assert "Hello" in stdout
@@ -176,21 +192,11 @@ class TestSubprocessEncoding:
 
     def test_replace_errors_prevents_unicode_decode_failure(self):
         """Should use replacement character instead of failing on bad bytes."""
-        import subprocess
-        import os
-
         # This test simulates what happens with invalid UTF-8 bytes
         # The 'errors=replace' should prevent UnicodeDecodeError
-        process = subprocess.Popen(
-            ["python", "-c", r"import sys; sys.stdout.buffer.write(b'test\x8fdata\n')"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            env={**os.environ, "PYTHONUNBUFFERED": "1"},
-        )
-        stdout, stderr = process.communicate(timeout=10)
+        stdout = _run_utf8(
+            ["python", "-c", r"import sys; sys.stdout.buffer.write(b'test\x8fdata\n')"]
+        ).stdout
 
         # Should not be None - the invalid byte should be replaced
         assert stdout is not None
@@ -201,29 +207,14 @@ class TestSubprocessEncoding:
 class TestScraperIntegration:
     """Integration tests for scraper JSON output."""
 
+    @pytest.mark.skipif(not _HAS_VENV, reason="Virtual environment not found")
     def test_reports_only_produces_json_summary(self):
         """Running --reports-only should produce JSON summary markers."""
-        import subprocess
-        import os
-        from pathlib import Path
-
-        project_root = Path(__file__).parent.parent.parent
-        venv_python = project_root / ".venv" / "Scripts" / "python.exe"
-
-        if not venv_python.exists():
-            pytest.skip("Virtual environment not found")
-
-        process = subprocess.Popen(
-            [str(venv_python), "baulkandcastle_scraper.py", "--reports-only"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            cwd=str(project_root),
-            env={**os.environ, "PYTHONUNBUFFERED": "1", "PYTHONIOENCODING": "utf-8"},
-        )
-        stdout, stderr = process.communicate(timeout=120)
+        stdout = _run_utf8(
+            [str(_VENV_PY), "baulkandcastle_scraper.py", "--reports-only"],
+            cwd=str(_PROJECT_ROOT),
+            timeout=120,
+        ).stdout
 
         assert stdout is not None, "stdout should not be None"
         assert "---JSON_SUMMARY_START---" in stdout, "Should contain JSON start marker"
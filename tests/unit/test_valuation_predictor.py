@@ -0,0 +1,145 @@
+"""
+Unit tests for valuation_predictor module.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from baulkandcastle.ml import valuation_predictor
+from baulkandcastle.ml.feature_engineering import FEATURE_COLUMNS
+from baulkandcastle.ml.valuation_predictor import PropertyValuationModel
+
+
+@pytest.fixture
+def trained_model(tmp_path) -> PropertyValuationModel:
+    """A tiny fitted model stored in a temporary model directory."""
+    from xgboost import XGBRegressor
+
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.uniform(0, 10, (40, len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    y = 500_000 + 50_000 * X["beds"]
+
+    model = PropertyValuationModel(model_dir=tmp_path)
+    model.model = XGBRegressor(n_estimators=5, max_depth=2)
+    model.model.fit(X, y)
+    model.metadata = {"metrics": {"mape": 10.0}}
+    return model
+
+
+@pytest.fixture
+def sales_df() -> pd.DataFrame:
+    """Synthetic sold listings with a shuffled, non-default index."""
+    rng = np.random.default_rng(0)
+    n = 80
+    df = pd.DataFrame({
+        "suburb": rng.choice(["CASTLE HILL", "Baulkham Hills"], n),
+        "property_type_consolidated": rng.choice(["house", "unit", "townhouse", "other"], n),
+        "land_size": rng.choice(["550m²", None, "1,200 m²", "300"], n),
+        "beds": rng.integers(1, 6, n),
+        "baths": rng.integers(1, 4, n),
+        "cars": rng.integers(0, 3, n),
+        "price_per_m2": rng.uniform(2000, 9000, n),
+        "sold_date_parsed": pd.to_datetime("2023-01-01")
+        + pd.to_timedelta(rng.integers(0, 600, n), unit="D"),
+    })
+    df.index = rng.permutation(np.arange(100, 100 + n))
+    return df
+
+
+class TestPrepareFeatures:
+    """Tests for prepare_features function."""
+
+    def test_keeps_input_order_and_index(self, sales_df, tmp_path):
+        model = PropertyValuationModel(model_dir=tmp_path)
+        result = model.prepare_features(sales_df)
+
+        assert result.index.equals(sales_df.index)
+        assert result["beds"].tolist() == sales_df["beds"].tolist()
+
+    def test_features_do_not_depend_on_input_order(self, sales_df, tmp_path):
+        model = PropertyValuationModel(model_dir=tmp_path)
+        result = model.prepare_features(sales_df)
+        reversed_result = model.prepare_features(sales_df.iloc[::-1])
+
+        pd.testing.assert_frame_equal(
+            result[FEATURE_COLUMNS], reversed_result.loc[sales_df.index, FEATURE_COLUMNS]
+        )
+
+
+class TestSaveLoad:
+    """Tests for model persistence alongside the legacy pickle."""
+
+    def test_save_writes_native_and_legacy_files(self, trained_model):
+        trained_model.save()
+        assert trained_model.model_path.exists()
+        assert trained_model.legacy_model_path.exists()
+        assert trained_model.model_path.stat().st_mtime >= trained_model.legacy_model_path.stat().st_mtime
+
+    @pytest.fixture
+    def joblib_loads(self, monkeypatch):
+        """Record the paths unpickled through joblib."""
+        loaded = []
+        real_load = valuation_predictor.joblib.load
+
+        def spy(path):
+            loaded.append(path)
+            return real_load(path)
+
+        monkeypatch.setattr(valuation_predictor.joblib, "load", spy)
+        return loaded
+
+    def test_load_prefers_newer_legacy_pickle(self, trained_model, joblib_loads):
+        trained_model.save()
+        native_mtime = trained_model.model_path.stat().st_mtime
+        os.utime(trained_model.legacy_model_path, (native_mtime + 60, native_mtime + 60))
+
+        loaded = PropertyValuationModel(model_dir=trained_model.model_dir)
+        assert loaded.load()
+        assert joblib_loads == [loaded.legacy_model_path]
+
+    def test_load_prefers_native_when_newest(self, trained_model, joblib_loads):
+        trained_model.save()
+
+        loaded = PropertyValuationModel(model_dir=trained_model.model_dir)
+        assert loaded.load()
+        assert joblib_loads == []
+        assert loaded.predict(beds=4)["predicted_price"] > 0
+
+
+class TestPredictBatch:
+    """Tests for predict_batch function."""
+
+    def test_matches_single_predictions(self, trained_model):
+        properties = [{"beds": 2, "property_type": "unit"}, {"beds": 4, "land_size": 600}]
+        results = trained_model.predict_batch(properties)
+        assert results == [trained_model.predict(**prop) for prop in properties]
+
+    def test_failing_row_gets_error_entry(self, trained_model):
+        # A non-numeric car_spaces featurizes fine but fails the batched model call
+        properties = [{"beds": 3}, {"car_spaces": "many", "land_size": 600}, {"beds": 4}]
+        results = trained_model.predict_batch(properties)
+
+        assert results[0] == trained_model.predict(beds=3)
+        assert results[2] == trained_model.predict(beds=4)
+        assert "error" in results[1]
+        assert results[1]["input"] == properties[1]
+
+
+class TestFeatureCachePath:
+    """Tests for the prepared-feature cache key."""
+
+    def test_key_changes_with_pipeline_version(self, tmp_path, monkeypatch):
+        db_path = tmp_path / "test.db"
+        db_path.write_bytes(b"")
+        model = PropertyValuationModel(model_dir=tmp_path / "models")
+
+        before = model._feature_cache_path(str(db_path), 10)
+        monkeypatch.setattr(
+            valuation_predictor,
+            "_FEATURE_PIPELINE_VERSION",
+            valuation_predictor._FEATURE_PIPELINE_VERSION + 1,
+        )
+        assert model._feature_cache_path(str(db_path), 10) != before